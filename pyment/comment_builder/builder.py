@@ -1,8 +1,27 @@
 # -*- coding: utf-8 -*-
+import re
+import threading
+
 from .strategy import CommentFormatStrategy
 from ..configs import CommentBuilderConfig, CaseConfig
 from ..utils import log_function
 
+# whitespace-only line following a newline
+_BLANK_LINE_RE = re.compile(r'(?<=\n)[^\S\n]+(?=\n|\Z)')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_POOL_SIZE = 16
+
+
+class _BuilderPools(threading.local):
+    """Released builders of the current thread, by builder class."""
+
+    def __init__(self):
+        self.by_class = {}
+
+
+_pools = _BuilderPools()
+
 
 class CommentBuilder(object):
     """Base class for building docstring comments.
@@ -18,7 +37,8 @@ class CommentBuilder(object):
     )
     
     def __repr__(self):
-        return f'<{self.__class__.__name__} name={self.case_config.name}>'
+        name = self.case_config.name if self.case_config is not None else None
+        return f'<{self.__class__.__name__} name={name}>'
     
     def __init__(self, config: CommentBuilderConfig, case_config: CaseConfig, strategy: CommentFormatStrategy):
         """Initialize the builder with configuration and strategy.
@@ -32,16 +52,43 @@ class CommentBuilder(object):
         
         # Data to build (set by setters)
         self.description = ''
-        self.params = []
+        self.params = ()
         self.return_desc = None
         self.return_type = None
-        self.raises = []
+        self.raises = ()
         self.post = ''
         self.doctests = ''
         self.element_name = None
         self.input_raw = None
         self.is_auto_generated_name = False
         self.has_existing_description = False
+
+    @classmethod
+    def acquire(cls, config: CommentBuilderConfig, case_config: CaseConfig, strategy: CommentFormatStrategy):
+        """Get a builder, reusing a released one if available.
+
+        :param config: CommentBuilderConfig instance containing all configuration
+        :param case_config: CaseConfig of the element to document
+        :param strategy: CommentFormatStrategy instance for formatting
+        :return: a builder in the same state as a newly created one
+        """
+        pool = _pools.by_class.get(cls)
+        if not pool:
+            return cls(config, case_config, strategy)
+        builder = pool.pop()
+        builder.__init__(config, case_config, strategy)
+        return builder
+
+    def release(self):
+        """Give the builder back for reuse by `acquire`. It must not be used afterwards."""
+        pool = _pools.by_class.setdefault(type(self), [])
+        if any(builder is self for builder in pool):
+            # already released
+            return
+        if len(pool) < _POOL_SIZE:
+            # don't keep the configs and the last element's data alive while it waits
+            self.__init__(None, None, None)
+            pool.append(self)
         
     def set_name(self, name):
         """Set the element name. Description is set to the name as-is.
@@ -70,12 +117,12 @@ class CommentBuilder(object):
         return self
         
     def set_params(self, params):
-        """Set the parameters list. Each param is (name, desc, type, default).
+        """Set the parameters. Each param is (name, desc, type, default).
         
-        :param params: list of parameter tuples
+        :param params: iterable of parameter tuples, stored as a tuple
         :return: self for method chaining
         """
-        self.params = params
+        self.params = tuple(params)
         return self
         
     def set_return(self, return_desc, return_type=None):
@@ -90,12 +137,12 @@ class CommentBuilder(object):
         return self
         
     def set_raises(self, raises):
-        """Set the raises list. Each raise is (name, desc).
+        """Set the raises. Each raise is (name, desc).
         
-        :param raises: list of raise tuples
+        :param raises: iterable of raise tuples, stored as a tuple
         :return: self for method chaining
         """
-        self.raises = raises
+        self.raises = tuple(raises)
         return self
         
     def set_post(self, post):
@@ -126,19 +173,17 @@ class CommentBuilder(object):
         return self
     
     @log_function
-    def _build_params_section(self, sep):
+    def _build_params_section(self):
         """Build the parameters section.
         
-        :param sep: separator for current style (kept for compatibility, may be unused)
         :return: formatted parameters section
         """
         return self.strategy.format_params_section(self.params)
     
     @log_function  
-    def _build_return_section(self, sep):
+    def _build_return_section(self):
         """Build the return section.
         
-        :param sep: separator for current style (kept for compatibility, may be unused)
         :return: formatted return section
         """
         return self.strategy.format_return_section(
@@ -148,10 +193,9 @@ class CommentBuilder(object):
         )
 
     @log_function
-    def _build_raises_section(self, sep):
+    def _build_raises_section(self):
         """Build the raises section.
         
-        :param sep: separator for current style (kept for compatibility, may be unused)
         :return: formatted raises section
         """
         return self.strategy.format_raises_section(
@@ -175,7 +219,10 @@ class CommentBuilder(object):
         
         :return: True if any sections are present, False otherwise
         """
-        return bool(self.params or self.return_desc or self.return_type or self.raises)
+        # lists are the cheapest to test and params is the most likely to be set
+        if self.params or self.raises:
+            return True
+        return bool(self.return_desc or self.return_type)
     
     def _with_space(self, text):
         """Add indentation to all lines except the first.
@@ -183,24 +230,20 @@ class CommentBuilder(object):
         :param text: text to indent
         :return: indented text
         """
-        lines = []
-        for i, l in enumerate(text.splitlines()):
-            if i == 0:
-                lines.append(l)
-                continue
-            # For completely empty lines, optionally leave them at zero level
-            if not l.strip() and not self.config.indent_empty_lines:
-                lines.append('')
-            else:
-                lines.append(self.case_config.spaces + l)
-        return '\n'.join(lines)
+        if '\n' not in text:
+            return text
+        text = text.replace('\n', '\n' + self.case_config.spaces)
+        # For completely empty lines, optionally leave them at zero level
+        if not self.config.indent_empty_lines:
+            text = _BLANK_LINE_RE.sub('', text)
+        return text
     
     def _build_docstring_start(self):
         """Build the initial docstring opening with quotes.
         
         :return: opening string with quotes
         """
-        return self.case_config.spaces + self.config.before_lim + self.config.quotes
+        return self.case_config.spaces + self.config._start_prefix
     
     @log_function
     def _build_single_line_docstring(self, desc):
@@ -209,28 +252,33 @@ class CommentBuilder(object):
         :param desc: description text
         :return: complete single-line docstring
         """
-        raw = self._build_docstring_start()
-        
-        if not self.config.first_line:
-            # Put description on its own line and close on a new line as well
-            raw += '\n' + self.case_config.spaces + (desc if desc else self.config.trailing_space)
-            raw += '\n' + self.case_config.spaces + self.config.quotes
-        elif self.is_auto_generated_name and self._should_use_one_line_format_with_spaces():
+        spaces = self.case_config.spaces
+        layout = self._single_line_layouts[bool(self.config.first_line), self.is_auto_generated_name]
+        return ''.join((spaces, self.config._start_prefix) + layout(self, desc, spaces)).rstrip()
+
+    def _single_line_on_new_line(self, desc, spaces):
+        # Put description on its own line and close on a new line as well
+        return '\n', spaces, desc if desc else self.config.trailing_space, '\n', spaces, self.config.quotes
+
+    def _single_line_auto_name(self, desc, spaces):
+        if self._should_use_one_line_format_with_spaces():
             # For classes with only class name, always use one-line format with spaces
-            raw += ' ' + desc + ' ' + self.config.quotes
-        elif self.is_auto_generated_name and self.config.first_line:
-            # For auto-generated descriptions with first_line=True, put description on same line
-            raw += desc if desc else self.config.trailing_space
-            if self.element_name == '__init__':
-                raw += '\n\n' + self.case_config.spaces + self.config.quotes
-            else:
-                raw += '\n' + self.case_config.spaces + self.config.quotes
-        else:
-            # Keep it on one line with triple quotes
-            raw += desc if desc else self.config.trailing_space
-            raw += self.config.quotes
-        
-        return raw.rstrip()
+            return ' ', desc, ' ', self.config.quotes
+        # For auto-generated descriptions with first_line=True, put description on same line
+        closing = '\n\n' if self.element_name == '__init__' else '\n'
+        return desc if desc else self.config.trailing_space, closing, spaces, self.config.quotes
+
+    def _single_line_inline(self, desc, spaces):
+        # Keep it on one line with triple quotes
+        return desc if desc else self.config.trailing_space, self.config.quotes
+
+    # layout of a docstring without sections by (first_line, is_auto_generated_name)
+    _single_line_layouts = {
+        (False, False): _single_line_on_new_line,
+        (False, True): _single_line_on_new_line,
+        (True, False): _single_line_inline,
+        (True, True): _single_line_auto_name,
+    }
     
     @log_function
     def _build_multi_line_description_only(self, desc):
@@ -239,21 +287,19 @@ class CommentBuilder(object):
         :param desc: description text
         :return: complete multi-line docstring
         """
-        raw = self._build_docstring_start()
+        parts = [self._build_docstring_start()]
         
         if not self.config.first_line:
-            raw += '\n' + self.case_config.spaces
+            parts += ('\n', self.case_config.spaces)
         
         # Preserve original formatting if description came from existing docstring
         if self.has_existing_description:
-            raw += self._with_space(self.description).rstrip() + '\n'
+            description = self.description.rstrip()
         else:
-            raw += self._with_space(self.description).strip() + '\n'
-        
-        if raw.count(self.config.quotes) == 1:
-            raw += self.case_config.spaces + self.config.quotes
+            description = self.description.strip()
+        parts += (self._with_space(description), '\n')
         
-        return raw.rstrip()
+        return self._close_docstring(''.join(parts))
 
     @log_function
     def _build_description_with_sections(self, desc):
@@ -262,19 +308,20 @@ class CommentBuilder(object):
         :param desc: description text
         :return: description section string
         """
-        result = ''
+        parts = []
 
         if not self.config.first_line:
             # put description on a new line
-            result += '\n' + self.case_config.spaces
+            parts += ('\n', self.case_config.spaces)
         # Preserve original formatting if description came from existing docstring
         if self.has_existing_description:
             # Preserve original line breaks and formatting
-            result += self._with_space(self.description).rstrip() + '\n'
+            description = self.description.rstrip()
         else:
-            result += self._with_space(self.description).strip() + '\n'
+            description = self.description.strip()
+        parts += (self._with_space(description), '\n')
         
-        return result
+        return ''.join(parts)
 
     @log_function
     def _build_additional_sections(self):
@@ -282,15 +329,16 @@ class CommentBuilder(object):
         
         :return: formatted post and doctests sections
         """
-        result = ''
+        spaces = self.case_config.spaces
+        parts = []
         
         if self.post:
-            result += self.case_config.spaces + self._with_space(self.post).strip() + '\n'
+            parts += (spaces, self._with_space(self.post.strip()), '\n')
         
         if self.doctests:
-            result += self.case_config.spaces + self._with_space(self.doctests).strip() + '\n'
+            parts += (spaces, self._with_space(self.doctests.strip()), '\n')
         
-        return result
+        return ''.join(parts)
     
     def _close_docstring(self, raw):
         """Close the docstring with quotes if needed.
@@ -298,8 +346,11 @@ class CommentBuilder(object):
         :param raw: current docstring content
         :return: docstring with closing quotes
         """
-        if raw.count(self.config.quotes) == 1:
-            raw += self.case_config.spaces + self.config.quotes
+        spaces = self.case_config.spaces
+        quotes = self.config.quotes
+        # the opening quotes are always there, only look for closing ones after them
+        if raw.find(quotes, len(spaces) + len(self.config._start_prefix)) == -1:
+            raw += spaces + quotes
         return raw.rstrip()
         
     def build(self):
@@ -307,20 +358,16 @@ class CommentBuilder(object):
         
         :return: complete docstring string
         """
-        sep = self.config.dst.get_sep(target='out')
-        sep = sep + ' ' if sep != ' ' else sep
-        
-        raw = self._build_docstring_start()
         desc = self.description.strip()
         has_sections = self._has_sections()
         
         # Handle docstrings without sections
         if not has_sections:
             # Preserve existing description formatting - don't collapse multi-line descriptions
-            if desc and desc.count('\n') and not self.has_existing_description:
-                desc = ' '.join(desc.split())
+            if '\n' in desc and not self.has_existing_description:
+                desc = _WHITESPACE_RE.sub(' ', desc)
             
-            if not desc or not desc.count('\n'):
+            if '\n' not in desc:
                 # Single-line docstring without parameters
                 return self._build_single_line_docstring(desc)
             else:
@@ -328,20 +375,23 @@ class CommentBuilder(object):
                 return self._build_multi_line_description_only(desc)
         
         # Handle docstrings with sections
-        raw += self._build_description_with_sections(desc)
-        
+        parts = [
+            self._build_docstring_start(),
+            self._build_description_with_sections(desc),
+        ]
         # Build sections
-        raw += self._build_params_section(sep)
-        raw += self._build_return_section(sep)
-        raw += self._build_raises_section(sep)
-        
+        if self.strategy.emits_sections:
+            parts += (
+                self._build_params_section(),
+                self._build_return_section(),
+                self._build_raises_section(),
+            )
         # Add post and doctests
-        raw += self._build_additional_sections()
+        parts.append(self._build_additional_sections())
         
-        res = self._close_docstring(raw)
-        res = '\n'.join(
-            (l.rstrip() if l.strip() != '' else (self.case_config.spaces if self.config.indent_empty_lines else ''))
-            for l in res.splitlines()
-        )
+        res = self._close_docstring(''.join(parts))
+        empty_line = self.case_config.spaces if self.config.indent_empty_lines else ''
+        # a line stripped to nothing was blank
+        res = '\n'.join([l.rstrip() or empty_line for l in res.splitlines()])
         
         return res
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import functools
+import re
 
 from .builder import CommentBuilder
 
@@ -8,70 +10,90 @@ MAGIC_METHODS = {
     '__str__': 'Convert to string',
 }
 
+# a word is any first character followed by everything up to the next ASCII capital
+_CAMEL_RE = re.compile(r'.[^A-Z]*')
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_name_as_description_cached(name):
+    """Format function name as a description by splitting into words and capitalizing first word.
+
+    Examples:
+    - hello_world -> "Hello world"
+    - calculate_total_sum -> "Calculate total sum"
+    - UserAccountManager -> "User account manager"
+    - __init__ -> "Initialize"
+    - func1 -> "Func1"
+
+    :param name: the function name
+    :type name: str
+    :return: formatted description
+    :rtype: str
+    """
+    if not name:
+        return ''
+
+    # Single lowercase word: nothing to split
+    if '_' not in name and name.islower():
+        return name[0].upper() + name[1:]
+
+    # Handle special methods like __init__, __str__, etc.
+    if name.startswith('__') and name.endswith('__'):
+        # Remove leading and trailing underscores
+        return MAGIC_METHODS.get(
+            name,
+            # Capitalize first letter
+            name[2].upper() + name[3:-2].lower()
+        )
+        return name
+
+    # Split on underscores first
+    parts = name.split('_')
+
+    # For each part, split on camelCase boundaries
+    words = []
+    for part in parts:
+        if not part:
+            continue
+
+        # Split camelCase: start a new word at each capital letter (except the first)
+        if part.isascii():
+            words.extend(_CAMEL_RE.findall(part))
+            continue
+        # the regex only knows the ASCII capitals
+        current_word = ''
+        for i, char in enumerate(part):
+            if char.isupper() and i > 0:
+                words.append(current_word)
+                current_word = char
+            else:
+                current_word += char
+        words.append(current_word)
+
+    if not words:
+        return name
+
+    # Join words with spaces and capitalize first word
+    result = ' '.join(words)
+    # Capitalize first letter only
+    return result[0].upper() + result[1:].lower() if len(result) > 1 else result.upper()
+
 
 class FunctionCommentBuilder(CommentBuilder):
     """Builder for function docstrings."""
     
+    __slots__ = ()  # Inherits all slots from CommentBuilder
+    
     def _format_name_as_description(self, name):
         """Format function name as a description by splitting into words and capitalizing first word.
-        
-        Examples:
-        - hello_world -> "Hello world"
-        - calculate_total_sum -> "Calculate total sum"
-        - UserAccountManager -> "User account manager"
-        - __init__ -> "Initialize"
-        - func1 -> "Func1"
-        
+
         :param name: the function name
         :type name: str
         :return: formatted description
         :rtype: str
         """
-        if not name:
-            return ''
-        
-        # Handle special methods like __init__, __str__, etc.
-        if name.startswith('__') and name.endswith('__'):
-            # Remove leading and trailing underscores
-            return MAGIC_METHODS.get(
-                name,
-                # Capitalize first letter
-                name[2].upper() + name[3:-2].lower()
-            )
-            return name
-        
-        # Split on underscores first
-        parts = name.split('_')
-        
-        # For each part, split on camelCase boundaries
-        words = []
-        for part in parts:
-            if not part:
-                continue
-            
-            # Split camelCase: insert space before each capital letter (except the first)
-            camel_parts = []
-            current_word = ''
-            for i, char in enumerate(part):
-                if char.isupper() and i > 0 and current_word:
-                    # Start a new word
-                    camel_parts.append(current_word)
-                    current_word = char
-                else:
-                    current_word += char
-            if current_word:
-                camel_parts.append(current_word)
-            
-            words.extend(camel_parts)
-        
-        if not words:
-            return name
-        
-        # Join words with spaces and capitalize first word
-        result = ' '.join(words)
-        # Capitalize first letter only
-        return result[0].upper() + result[1:].lower() if len(result) > 1 else result.upper()
-    
+        return _format_name_as_description_cached(name)
+
     def set_name(self, name):
         """Set the function name and generate description from it.
         
@@ -1,8 +1,78 @@
 # -*- coding: utf-8 -*-
 
 """Strategy pattern implementation for docstring formatting styles."""
+import functools
+import io
+import re
+import threading
+
 from pyment.configs import CaseConfig
-from pyment.utils import log_function
+
+# sections lists of the styles without sections
+_NO_SECTIONS = frozenset()
+
+# a description already giving the default value doesn't get one appended
+_mentions_default = re.compile('default', re.IGNORECASE).search
+
+
+class _PartsBuffer(threading.local):
+    """Fragment list of the current thread, reused by every format call."""
+
+    def __init__(self):
+        self.parts = []
+
+
+_buffer = _PartsBuffer()
+
+
+def _new_parts(*fragments):
+    """Get the emptied fragment list of the current thread, starting with the given fragments.
+
+    The list is only valid until the next call, so it must be joined before formatting another section.
+
+    :param fragments: first fragments of the section
+    :return: the fragment list
+    """
+    parts = _buffer.parts
+    parts.clear()
+    parts.extend(fragments)
+    return parts
+
+
+# above this size, indented text is written to a buffer instead of joining a list of lines
+_BUFFERED_TEXT_SIZE = 4096
+
+
+def _reindent(s, prefix, indent_empty, keep_indent=False):
+    """Put a prefix in front of all lines except the first.
+
+    :param s: text to indent
+    :param prefix: indentation to put in front of the lines after the first
+    :param indent_empty: if not set, blank lines are left empty
+    :param keep_indent: if set, the prefix is added to the lines own indentation instead of replacing it
+    :return: indented text
+    """
+    if '\n' not in s:
+        return s
+    first, _, rest = s.partition('\n')
+    if len(s) > _BUFFERED_TEXT_SIZE:
+        buf = io.StringIO()
+        buf.write(first)
+        for l in rest.splitlines():
+            stripped = l.lstrip()
+            buf.write('\n')
+            if stripped or indent_empty:
+                buf.write(prefix)
+                buf.write(l if keep_indent else stripped)
+        return buf.getvalue()
+    if keep_indent:
+        lines = [prefix + l if indent_empty or l.lstrip() else ''
+                 for l in rest.splitlines()]
+    else:
+        lines = [prefix + stripped if (stripped := l.lstrip()) or indent_empty else ''
+                 for l in rest.splitlines()]
+    lines.insert(0, first)
+    return '\n'.join(lines)
 
 
 class CommentFormatStrategy(object):
@@ -13,6 +83,10 @@ class CommentFormatStrategy(object):
     (google, numpydoc, javadoc, reST, groups, etc.).
     """
 
+    # if not set, all the format_*_section methods return an empty string
+    # and the builder doesn't call them
+    emits_sections = True
+
     def __init__(self, config, case_config):
         """Initialize with CommentBuilderConfig instance."""
         self.config = config
@@ -77,16 +151,64 @@ class CommentFormatStrategy(object):
         raise NotImplementedError
 
 
+@functools.lru_cache(maxsize=64)
+def _numpydoc_params_formatter(header, spaces, desc_indent, skip_empty, indent_empty, show_default):
+    """Get a function formatting the parameters section in NumPy style for the given options.
+
+    :param header: section header, already indented
+    :param spaces: indentation of the parameters
+    :param desc_indent: indentation of the descriptions
+    :param skip_empty: if set, no section is made without parameters
+    :param indent_empty: if not set, blank lines of the descriptions are left empty
+    :param show_default: if set, the default value is appended to the descriptions
+    :return: function taking the list of parameter tuples (name, desc, type, default)
+    """
+    def format_params_section(params):
+        """Format parameters section in NumPy style."""
+        if skip_empty and not params:
+            return '\n'
+        parts = _new_parts('\n', header)
+        for name, text, ptype, default in params:
+            parts.append(f'{spaces}{name} :')
+            if ptype:
+                parts.append(f' {ptype}')
+            # most descriptions are a single line, with nothing to indent
+            desc = text.strip() if '\n' not in text else _reindent(text, desc_indent, indent_empty).strip()
+            parts.append(f'\n{desc_indent}{desc}')
+            if show_default and default is not None and not _mentions_default(text):
+                # Add space before default value only if there's a description
+                parts.append(f"{' ' if desc else ''}(Default value = {default!s})")
+            parts.append('\n')
+        return ''.join(parts)
+    return format_params_section
+
+
 class NumpydocStrategy(CommentFormatStrategy):
     """Strategy for NumPy-style docstring formatting."""
     
     def __init__(self, config, case_config):
         super().__init__(config, case_config)
         self.tools = config.dst.numpydoc
+        self._excluded = frozenset(self.tools.get_excluded_sections())
+        self._mandatory = frozenset(self.tools.get_mandatory_sections())
+        self._optional = frozenset(self.tools.get_optional_sections())
+        self._raise_excluded = 'raise' in self._excluded
+        self._raise_mandatory = 'raise' in self._mandatory
+        self._raise_optional = 'raise' in self._optional
+        # formatting of the params only depends on the config, use a formatter specialized for it
+        spaces = case_config.spaces
+        self.format_params_section = _numpydoc_params_formatter(
+            self.get_key_section_header('param', spaces), spaces, spaces + config._indent_spaces,
+            config.skip_empty, config.indent_empty_lines, config.show_default_value)
     
     def get_key_section_header(self, key, spaces):
         """Get NumPy-style section header."""
-        return self.tools.get_key_section_header(key, spaces)
+        cache = self.config._header_cache
+        cache_key = (self.tools, key, spaces)
+        header = cache.get(cache_key)
+        if header is None:
+            header = cache[cache_key] = self.tools.get_key_section_header(key, spaces)
+        return header
     
     def get_excluded_sections(self):
         """Get excluded sections."""
@@ -100,43 +222,6 @@ class NumpydocStrategy(CommentFormatStrategy):
         """Get optional sections."""
         return self.tools.get_optional_sections()
     
-    def format_params_section(self, params):
-        """Format parameters section in NumPy style."""
-        raw = '\n'
-        if self.config.skip_empty and not params:
-            return raw
-        
-        indent_spaces = ' ' * self.config.num_of_spaces
-
-        def with_space(s):
-            lines = []
-            for i, l in enumerate(s.splitlines()):
-                if i == 0:
-                    lines.append(l)
-                    continue
-                stripped = l.lstrip()
-                if not stripped and not self.config.indent_empty_lines:
-                    lines.append('')
-                else:
-                    lines.append(self.case_config.spaces + indent_spaces + stripped)
-            return '\n'.join(lines)
-        
-        raw += self.get_key_section_header('param', self.case_config.spaces)
-        for p in params:
-            raw += self.case_config.spaces + p[0] + ' :'
-            if p[2] is not None and len(p[2]) > 0:
-                raw += ' ' + p[2]
-            raw += '\n'
-            raw += self.case_config.spaces + indent_spaces + with_space(p[1]).strip()
-            if len(p) > 2:
-                if self.config.show_default_value and 'default' not in p[1].lower() and len(p) > 3 and p[3] is not None:
-                    # Add space before default value only if there's a description
-                    desc_stripped = p[1].strip() if p[1] else ''
-                    space_before = ' ' if desc_stripped else ''
-                    raw += space_before + '(Default value = ' + str(p[3]) + ')'
-            raw += '\n'
-        return raw
-    
     def format_return_section(self, return_desc, return_type, params):
         """Format return section in NumPy style."""
         raw = ''
@@ -144,47 +229,38 @@ class NumpydocStrategy(CommentFormatStrategy):
             return raw
         
         raw += '\n'
-        indent_spaces = ' ' * self.config.num_of_spaces
-
-        def with_space(s):
-            lines = []
-            for i, l in enumerate(s.splitlines()):
-                if i == 0:
-                    lines.append(l)
-                    continue
-                stripped = l.lstrip()
-                if not stripped and not self.config.indent_empty_lines:
-                    lines.append('')
-                else:
-                    lines.append(self.case_config.spaces + indent_spaces + stripped)
-            return '\n'.join(lines)
-        
-        raw += self.get_key_section_header('return', self.case_config.spaces)
+        spaces = self.case_config.spaces
+        indent_empty = self.config.indent_empty_lines
+        desc_indent = spaces + self.config._indent_spaces
+
+        parts = _new_parts(raw, self.get_key_section_header('return', spaces))
         if return_type:
             rtype = return_type
         else:
             rtype = 'type'
         
         # case of several returns
-        if type(return_desc) is list:
+        if return_desc.__class__ is list:
             for ret_elem in return_desc:
                 # if tuple (name, desc, rtype) else string desc
-                if type(ret_elem) is tuple and len(ret_elem) == 3:
-                    rtype = ret_elem[2]
+                if ret_elem.__class__ is tuple:
+                    name, desc, rtype = ret_elem
                     if rtype is None:
                         rtype = ''
-                    raw += self.case_config.spaces
-                    if ret_elem[0]:
-                        raw += ret_elem[0] + ' : '
-                    raw += rtype + '\n' + self.case_config.spaces + indent_spaces + with_space(ret_elem[1]).strip() + '\n'
+                    parts.append(f'{spaces}{name} : ' if name else spaces)
+                    desc = desc.strip() if '\n' not in desc else _reindent(desc, desc_indent, indent_empty).strip()
+                    parts.append(f'{rtype}\n{desc_indent}{desc}\n')
                 else:
-                    raw += self.case_config.spaces + rtype + '\n'
-                    raw += self.case_config.spaces + indent_spaces + with_space(str(ret_elem)).strip() + '\n'
+                    desc = _reindent(str(ret_elem), desc_indent, indent_empty).strip()
+                    parts.append(f'{spaces}{rtype}\n{desc_indent}{desc}\n')
         # case of a unique return
         elif return_desc is not None:
-            raw += self.case_config.spaces + rtype
-            raw += '\n' + self.case_config.spaces + indent_spaces + with_space(return_desc).strip() + '\n'
-        return raw
+            if '\n' not in return_desc:
+                desc = return_desc.strip()
+            else:
+                desc = _reindent(return_desc, desc_indent, indent_empty).strip()
+            parts.append(f'{spaces}{rtype}\n{desc_indent}{desc}\n')
+        return ''.join(parts)
     
     def format_raises_section(self, raises, params, return_desc):
         """Format raises section in NumPy style."""
@@ -192,30 +268,22 @@ class NumpydocStrategy(CommentFormatStrategy):
         if self.config.skip_empty and not raises:
             return raw
         
-        if 'raise' not in self.get_excluded_sections():
+        if not self._raise_excluded:
             raw += '\n'
-            if 'raise' in self.get_mandatory_sections() or \
-                    (raises and 'raise' in self.get_optional_sections()):
-                indent_spaces = ' ' * self.config.num_of_spaces
-
-                def with_space(s):
-                    lines = []
-                    for i, l in enumerate(s.splitlines()):
-                        if i == 0:
-                            lines.append(l)
-                            continue
-                        stripped = l.lstrip()
-                        if not stripped and not self.config.indent_empty_lines:
-                            lines.append('')
-                        else:
-                            lines.append(self.case_config.spaces + indent_spaces + stripped)
-                    return '\n'.join(lines)
-                raw += self.get_key_section_header('raise', self.case_config.spaces)
-                if len(raises):
-                    for p in raises:
-                        raw += self.case_config.spaces + p[0] + '\n'
-                        raw += self.case_config.spaces + indent_spaces + with_space(p[1]).strip() + '\n'
-                raw += '\n'
+            if self._raise_mandatory or (raises and self._raise_optional):
+                spaces = self.case_config.spaces
+                indent_empty = self.config.indent_empty_lines
+                desc_indent = spaces + self.config._indent_spaces
+
+                parts = _new_parts(raw, self.get_key_section_header('raise', spaces))
+                for p in raises:
+                    if '\n' not in p[1]:
+                        desc = p[1].strip()
+                    else:
+                        desc = _reindent(p[1], desc_indent, indent_empty).strip()
+                    parts.extend((spaces, p[0], f'\n{desc_indent}{desc}\n'))
+                parts.append('\n')
+                raw = ''.join(parts)
         return raw
 
 
@@ -229,10 +297,21 @@ class GoogleStrategy(CommentFormatStrategy):
         """
         super().__init__(config, case_config)
         self.tools = config.dst.googledoc
+        self._excluded = frozenset(self.tools.get_excluded_sections())
+        self._mandatory = frozenset(self.tools.get_mandatory_sections())
+        self._optional = frozenset(self.tools.get_optional_sections())
+        self._raise_excluded = 'raise' in self._excluded
+        self._raise_mandatory = 'raise' in self._mandatory
+        self._raise_optional = 'raise' in self._optional
     
     def get_key_section_header(self, key, spaces):
         """Get Google-style section header."""
-        return self.tools.get_key_section_header(key, spaces)
+        cache = self.config._header_cache
+        cache_key = (self.tools, key, spaces)
+        header = cache.get(cache_key)
+        if header is None:
+            header = cache[cache_key] = self.tools.get_key_section_header(key, spaces)
+        return header
     
     def get_excluded_sections(self):
         """Get excluded sections."""
@@ -252,38 +331,24 @@ class GoogleStrategy(CommentFormatStrategy):
         if self.config.skip_empty and not params:
             return raw
         
-        indent_spaces = ' ' * self.config.num_of_spaces
-
-        def with_space(s):
-            lines = []
-            for i, l in enumerate(s.splitlines()):
-                if i == 0:
-                    lines.append(l)
-                    continue
-                stripped = l.lstrip()
-                if not stripped and not self.config.indent_empty_lines:
-                    lines.append('')
-                else:
-                    lines.append(self.case_config.spaces + stripped)
-            return '\n'.join(lines)
-        
-        raw += self.get_key_section_header('param', self.case_config.spaces)
-        for p in params:
-            raw += self.case_config.spaces + indent_spaces + p[0]
-            if p[2] is not None and len(p[2]) > 0:
-                raw += ' (' + p[2]
-                if len(p) > 3 and p[3] is not None:
-                    raw += ', optional'
-                raw += ')'
-            raw += ': ' + with_space(p[1]).strip()
-            if len(p) > 2:
-                if self.config.show_default_value and 'default' not in p[1].lower() and len(p) > 3 and p[3] is not None:
-                    # Add space before default value only if there's a description
-                    desc_stripped = p[1].strip() if p[1] else ''
-                    space_before = ' ' if desc_stripped else ''
-                    raw += space_before + '(Default value = ' + str(p[3]) + ')'
-            raw += '\n'
-        return raw
+        spaces = self.case_config.spaces
+        indent_empty = self.config.indent_empty_lines
+        show_default = self.config.show_default_value
+        full = spaces + self.config._indent_spaces
+
+        parts = _new_parts(raw, self.get_key_section_header('param', spaces))
+        for name, text, ptype, default in params:
+            parts.append(f'{full}{name}')
+            if ptype:
+                parts.append(f' ({ptype}, optional)' if default is not None else f' ({ptype})')
+            # most descriptions are a single line, with nothing to indent
+            desc = text.strip() if '\n' not in text else _reindent(text, spaces, indent_empty).strip()
+            parts.append(f': {desc}')
+            if show_default and default is not None and not _mentions_default(text):
+                # Add space before default value only if there's a description
+                parts.append(f"{' ' if desc else ''}(Default value = {default!s})")
+            parts.append('\n')
+        return ''.join(parts)
     
     def format_return_section(self, return_desc, return_type, params):
         """Format return section in Google style."""
@@ -292,51 +357,43 @@ class GoogleStrategy(CommentFormatStrategy):
             return raw
         
         raw += '\n'
-        indent_spaces = ' ' * self.config.num_of_spaces
-
-        def with_space(s):
-            lines = []
-            for i, l in enumerate(s.splitlines()):
-                if i == 0:
-                    lines.append(l)
-                    continue
-                stripped = l.lstrip()
-                if not stripped and not self.config.indent_empty_lines:
-                    lines.append('')
-                else:
-                    lines.append(self.case_config.spaces + indent_spaces + stripped)
-            return '\n'.join(lines)
-        
-        raw += self.get_key_section_header('return', self.case_config.spaces)
+        spaces = self.case_config.spaces
+        indent_empty = self.config.indent_empty_lines
+        desc_indent = spaces + self.config._indent_spaces
+
+        parts = _new_parts(raw, self.get_key_section_header('return', spaces))
         if return_type:
             rtype = return_type
         else:
             rtype = None
         
         # case of several returns
-        if type(return_desc) is list:
+        if return_desc.__class__ is list:
             for ret_elem in return_desc:
                 # if tuple (name=None, desc, rtype) else string desc
-                if type(ret_elem) is tuple and len(ret_elem) == 3:
-                    rtype = ret_elem[2]
+                if ret_elem.__class__ is tuple:
+                    _, desc, rtype = ret_elem
                     if rtype is None:
                         rtype = ''
-                    raw += self.case_config.spaces + indent_spaces
-                    raw += rtype + ': ' + with_space(ret_elem[1]).strip() + '\n'
+                    desc = desc.strip() if '\n' not in desc else _reindent(desc, desc_indent, indent_empty).strip()
+                    parts.append(f'{desc_indent}{rtype}: {desc}\n')
                 else:
+                    desc = _reindent(str(ret_elem), desc_indent, indent_empty).strip()
                     if rtype:
-                        raw += self.case_config.spaces + indent_spaces + rtype + ': '
-                        raw += with_space(str(ret_elem)).strip() + '\n'
+                        parts.append(f'{desc_indent}{rtype}: {desc}\n')
                     else:
-                        raw += self.case_config.spaces + indent_spaces + with_space(str(ret_elem)).strip() + '\n'
+                        parts.append(f'{desc_indent}{desc}\n')
         # case of a unique return
         elif return_desc is not None:
+            if '\n' not in return_desc:
+                desc = return_desc.strip()
+            else:
+                desc = _reindent(return_desc, desc_indent, indent_empty).strip()
             if rtype:
-                raw += self.case_config.spaces + indent_spaces + rtype + ': '
-                raw += with_space(return_desc).strip() + '\n'
+                parts.append(f'{desc_indent}{rtype}: {desc}\n')
             else:
-                raw += self.case_config.spaces + indent_spaces + with_space(return_desc).strip() + '\n'
-        return raw
+                parts.append(f'{desc_indent}{desc}\n')
+        return ''.join(parts)
     
     def format_raises_section(self, raises, params, return_desc):
         """Format raises section in Google style."""
@@ -344,34 +401,21 @@ class GoogleStrategy(CommentFormatStrategy):
         if self.config.skip_empty and not raises:
             return raw
         
-        if 'raise' not in self.get_excluded_sections():
+        if not self._raise_excluded:
             raw += '\n'
-            if 'raise' in self.get_mandatory_sections() or \
-                    (raises and 'raise' in self.get_optional_sections()):
-                indent_spaces = ' ' * self.config.num_of_spaces
-
-                def with_space(s):
-                    lines = []
-                    for i, l in enumerate(s.splitlines()):
-                        if i == 0:
-                            lines.append(l)
-                            continue
-                        stripped = l.lstrip()
-                        if not stripped and not self.config.indent_empty_lines:
-                            lines.append('')
-                        else:
-                            lines.append(self.case_config.spaces + indent_spaces + stripped)
-                    return '\n'.join(lines)
-                raw += self.get_key_section_header('raise', self.case_config.spaces)
-                if len(raises):
-                    for p in raises:
-                        raw += self.case_config.spaces + indent_spaces
-                        if p[0] is not None:
-                            raw += p[0] + ': '
-                        if p[1]:
-                            raw += p[1].strip()
-                        raw += '\n'
-                raw += '\n'
+            if self._raise_mandatory or (raises and self._raise_optional):
+                spaces = self.case_config.spaces
+                full = spaces + self.config._indent_spaces
+                parts = _new_parts(raw, self.get_key_section_header('raise', spaces))
+                for p in raises:
+                    parts.append(full)
+                    if p[0] is not None:
+                        parts.append(f'{p[0]}: ')
+                    if p[1]:
+                        parts.append(p[1].strip())
+                    parts.append('\n')
+                parts.append('\n')
+                raw = ''.join(parts)
         return raw
 
 
@@ -392,17 +436,16 @@ class DefaultStrategy(CommentFormatStrategy):
     
     def get_excluded_sections(self):
         """Get excluded sections (empty for default)."""
-        return []
+        return _NO_SECTIONS
     
     def get_mandatory_sections(self):
         """Get mandatory sections (empty for default)."""
-        return []
+        return _NO_SECTIONS
     
     def get_optional_sections(self):
         """Get optional sections (empty for default)."""
-        return []
+        return _NO_SECTIONS
     
-    @log_function
     def format_params_section(self, params):
         """Format parameters section in default style (javadoc/reST)."""
         raw = '\n'
@@ -410,34 +453,28 @@ class DefaultStrategy(CommentFormatStrategy):
             return raw
         
         sep = self.docs_tools.get_sep(target='out')
-        sep = sep + ' ' if sep != ' ' else sep
-        
-        def with_space(s):
-            lines = []
-            for i, l in enumerate(s.splitlines()):
-                if i == 0:
-                    lines.append(l)
-                    continue
-                if not l.strip() and not self.config.indent_empty_lines:
-                    lines.append('')
-                else:
-                    lines.append(self.case_config.spaces + '    ' + l.lstrip())
-            return '\n'.join(lines)
+        sep = f'{sep} ' if sep != ' ' else sep
         
-        if len(params):
-            for p in params:
-                raw += self.case_config.spaces + self.docs_tools.get_key('param', 'out') + ' ' + p[0] + sep + with_space(p[1]).strip()
-                if len(p) > 2:
-                    if self.config.show_default_value and 'default' not in p[1].lower() and len(p) > 3 and p[3] is not None:
-                        # Add space before default value only if there's a description
-                        desc_stripped = p[1].strip() if p[1] else ''
-                        space_before = ' ' if desc_stripped else ''
-                        raw += space_before + '(Default value = ' + str(p[3]) + ')'
-                    if self.config.type_tags and p[2] is not None and len(p[2]) > 0:
-                        raw += '\n'
-                        raw += self.case_config.spaces + self.docs_tools.get_key('type', 'out') + ' ' + p[0] + sep + p[2]
-                raw += '\n'
-        return raw
+        spaces = self.case_config.spaces
+        indent_empty = self.config.indent_empty_lines
+        show_default = self.config.show_default_value
+        type_tags = self.config.type_tags
+        param_key = self.docs_tools.get_key('param', 'out')
+        type_key = self.docs_tools.get_key('type', 'out')
+        desc_indent = spaces + '    '
+
+        parts = _new_parts(raw)
+        for name, text, ptype, default in params:
+            # most descriptions are a single line, with nothing to indent
+            desc = text.strip() if '\n' not in text else _reindent(text, desc_indent, indent_empty).strip()
+            parts.append(f'{spaces}{param_key} {name}{sep}{desc}')
+            if show_default and default is not None and not _mentions_default(text):
+                # Add space before default value only if there's a description
+                parts.append(f"{' ' if desc else ''}(Default value = {default!s})")
+            if type_tags and ptype:
+                parts.append(f'\n{spaces}{type_key} {name}{sep}{ptype}')
+            parts.append('\n')
+        return ''.join(parts)
     
     def format_return_section(self, return_desc, return_type, params):
         """Format return section in default style (javadoc/reST)."""
@@ -449,35 +486,28 @@ class DefaultStrategy(CommentFormatStrategy):
             return raw
         
         sep = self.docs_tools.get_sep(target='out')
-        sep = sep + ' ' if sep != ' ' else sep
-        
-        def with_space(s):
-            lines = []
-            for i, l in enumerate(s.splitlines()):
-                if i == 0:
-                    lines.append(l)
-                    continue
-                if not l.strip() and not self.config.indent_empty_lines:
-                    lines.append('')
-                else:
-                    lines.append(self.case_config.spaces + l)
-            return '\n'.join(lines)
+        sep = f'{sep} ' if sep != ' ' else sep
         
+        spaces = self.case_config.spaces
+        type_tags = self.config.type_tags
+
+        parts = _new_parts()
         if return_desc:
             if not params:
-                raw += '\n'
-            raw += self.case_config.spaces + self.docs_tools.get_key('return', 'out') + sep + with_space(return_desc.rstrip()).strip() + '\n'
-        elif return_type and not self.config.type_tags:
+                parts.append('\n')
+            desc = _reindent(return_desc.rstrip(), spaces, self.config.indent_empty_lines, keep_indent=True).strip()
+            parts.append(f"{spaces}{self.docs_tools.get_key('return', 'out')}{sep}{desc}\n")
+        elif return_type and not type_tags:
             # When type tags are disabled but a return type exists (e.g. from
             # annotations), still emit a :return: line with an empty description.
             if not params:
-                raw += '\n'
-            raw += self.case_config.spaces + self.docs_tools.get_key('return', 'out') + sep + '\n'
-        if self.config.type_tags and return_type:
+                parts.append('\n')
+            parts.append(f"{spaces}{self.docs_tools.get_key('return', 'out')}{sep}\n")
+        if type_tags and return_type:
             if not params:
-                raw += '\n'
-            raw += self.case_config.spaces + self.docs_tools.get_key('rtype', 'out') + sep + return_type.rstrip() + '\n'
-        return raw
+                parts.append('\n')
+            parts.append(f"{spaces}{self.docs_tools.get_key('rtype', 'out')}{sep}{return_type.rstrip()}\n")
+        return ''.join(parts)
     
     def format_raises_section(self, raises, params, return_desc):
         """Format raises section in default style (javadoc/reST)."""
@@ -486,37 +516,33 @@ class DefaultStrategy(CommentFormatStrategy):
             return raw
         
         sep = self.docs_tools.get_sep(target='out')
-        sep = sep + ' ' if sep != ' ' else sep
+        sep = f'{sep} ' if sep != ' ' else sep
         
-        def with_space(s):
-            lines = []
-            for i, l in enumerate(s.splitlines()):
-                if i == 0:
-                    lines.append(l)
-                    continue
-                if not l.strip() and not self.config.indent_empty_lines:
-                    lines.append('')
-                else:
-                    lines.append(self.case_config.spaces + l)
-            return '\n'.join(lines)
-        
-        if len(raises):
+        parts = _new_parts()
+        if raises:
             if not params and not return_desc:
-                raw += '\n'
+                parts.append('\n')
+            spaces = self.case_config.spaces
+            indent_empty = self.config.indent_empty_lines
+            raise_key = self.docs_tools.get_key('raise', 'out')
             for p in raises:
-                raw += self.case_config.spaces + self.docs_tools.get_key('raise', 'out') + ' '
+                parts.append(f'{spaces}{raise_key} ')
                 if p[0] is not None:
-                    raw += p[0] + sep
-                if p[1]:
-                    raw += with_space(p[1]).strip()
-                raw += '\n'
-        raw += '\n'
-        return raw
+                    parts.append(f'{p[0]}{sep}')
+                if p[1] and '\n' not in p[1]:
+                    parts.append(p[1].strip())
+                elif p[1]:
+                    parts.append(_reindent(p[1], spaces, indent_empty, keep_indent=True).strip())
+                parts.append('\n')
+        parts.append('\n')
+        return ''.join(parts)
 
 
 class GroupsStrategy(CommentFormatStrategy):
     """Strategy for groups-style docstring formatting."""
 
+    emits_sections = False
+
     def __init__(self, config, case_config):
         """Initialize with CommentBuilderConfig instance.
 
@@ -531,15 +557,15 @@ class GroupsStrategy(CommentFormatStrategy):
     
     def get_excluded_sections(self):
         """Get excluded sections (empty for groups)."""
-        return []
+        return _NO_SECTIONS
     
     def get_mandatory_sections(self):
         """Get mandatory sections (empty for groups)."""
-        return []
+        return _NO_SECTIONS
     
     def get_optional_sections(self):
         """Get optional sections (empty for groups)."""
-        return []
+        return _NO_SECTIONS
     
     def format_params_section(self, params):
         """Format parameters section in groups style (no-op)."""
@@ -554,6 +580,14 @@ class GroupsStrategy(CommentFormatStrategy):
         return ''
 
 
+# strategy class by output style, any other style uses DefaultStrategy (javadoc, reST, etc.)
+_STRATEGIES = {
+    'numpydoc': NumpydocStrategy,
+    'google': GoogleStrategy,
+    'groups': GroupsStrategy,
+}
+
+
 def create_strategy(style_name, config, case_config: CaseConfig):
     """Factory function to create the appropriate strategy based on style name.
     
@@ -561,13 +595,4 @@ def create_strategy(style_name, config, case_config: CaseConfig):
     :param config: CommentBuilderConfig instance
     :return: CommentFormatStrategy instance
     """
-    if style_name == 'numpydoc':
-        return NumpydocStrategy(config, case_config)
-    elif style_name == 'google':
-        return GoogleStrategy(config, case_config)
-    elif style_name == 'groups':
-        return GroupsStrategy(config, case_config)
-    else:
-        # Default for javadoc, reST, etc.
-        return DefaultStrategy(config, case_config)
-
+    return _STRATEGIES.get(style_name, DefaultStrategy)(config, case_config)
@@ -28,10 +28,20 @@ class CommentBuilderConfig:
     type_tags: bool = True
     method_scope: list[str] = field(default_factory=list)
     output_style: str = 'reST'
+    # section headers by (docs tools, key, spaces)
+    _header_cache: dict = field(init=False, repr=False, compare=False, default_factory=dict)
 
     def __post_init__(self):
         self.dst.style['out'] = self.output_style
 
+    @property
+    def _start_prefix(self):
+        return self.before_lim + self.quotes
+
+    @property
+    def _indent_spaces(self):
+        return ' ' * self.num_of_spaces
+
 
 @dataclasses.dataclass(slots=True)
 class ReadConfig:
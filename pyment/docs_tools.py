@@ -1,9 +1,89 @@
+import collections
+import concurrent.futures
 import dataclasses
+import functools
 import re
-from collections import defaultdict
+import sys
 
 from pyment.domain import ParamsConfig
-from pyment.utils import isin_alone, isin_start, isin, get_leading_spaces, RAISES_NAME_REGEX
+from pyment.utils import get_leading_spaces, RAISES_NAME_REGEX
+
+# the names, after any spaces
+_RAISES_NAME_RE = re.compile(r'\s*' + RAISES_NAME_REGEX.lstrip('^'))
+_NAME_RE = re.compile(r'\s*(\w+)')
+# the first word, after any non word characters
+_FIRST_WORD_RE = re.compile(r'\W*(\w+)')
+# the first two words, like a parameter's name and type
+_TWO_WORDS_RE = re.compile(r'\W*(\w+)\W+(\w+)\W*')
+
+# a line made only of dashes, once stripped
+_NUMPYDOC_UNDERLINE_RE = re.compile(r'^[^\S\n]*-+[^\S\n]*$', re.M)
+# number of docstrings whose detected style is kept by a DocsTools
+_DETECTED_STYLES_SIZE = 1024
+
+
+def _line_start_re(names):
+    """Compile a regex matching the start of the lines beginning with one of the names.
+
+    :param names: the names to look for, lowered
+    :returns: the compiled multiline regex
+
+    """
+    return re.compile(r'^[^\S\n]*(?:%s)' % '|'.join(map(re.escape, names)), re.M)
+
+
+def _line_index(lines, line_number):
+    """Get the index in the original string of the start of a line.
+
+    :param lines: the lines of the string, without their ends
+    :param line_number: the line number, or -1
+    :returns: the index of the line if line_number is not -1 else -1
+
+    """
+    if line_number == -1:
+        return -1
+    # each line was followed by a newline
+    return sum(map(len, lines[:line_number])) + line_number
+
+
+@functools.lru_cache(maxsize=64)
+def _numpydoc_list_key_parser(spaces):
+    """Get a function parsing the lines of a numpydoc section for the given indentation.
+
+    :param spaces: leading spaces of the section's starting line
+    :returns: function taking the list of lines and returning the list of key elements
+
+    """
+    sp_len = len(spaces)
+
+    def parse(lines):
+        """Parse lines and extract the list of key elements."""
+        key_list = []
+        parse_key = False
+        # the description's lines, none of them being empty
+        key, desc, ptype = None, [], None
+        for line in lines:
+            stripped = line.lstrip()
+            if not stripped:
+                continue
+            indent = len(line) - len(stripped)
+            # on the same column of the key is the key
+            if indent == sp_len:
+                if parse_key:
+                    key_list.append((key, '\n'.join(desc), ptype))
+                elems = line.split(':', 1)
+                key = elems[0].strip()
+                ptype = elems[1].strip() if len(elems) > 1 else None
+                desc = []
+                parse_key = True
+            else:
+                if indent > sp_len and line.startswith(spaces):
+                    line = line[sp_len:]
+                desc.append(line)
+        if parse_key:
+            key_list.append((key, '\n'.join(desc), ptype))
+        return key_list
+    return parse
 
 
 @dataclasses.dataclass(slots=True)
@@ -12,10 +92,19 @@ class ParsedElement:
     name: str
 
 
+@dataclasses.dataclass(slots=True)
+class ParamInfo:
+    type: str = None
+    type_in_param: str = None
+    description: str = None
+
+
 class DocToolsBase(object):
     """
 
     """
+    # what follows a section's name on its line
+    _section_key_extension = ''
 
     def __init__(self,
                  first_line=None,
@@ -42,8 +131,18 @@ class DocToolsBase(object):
         """
         self.optional_sections = list(optional_sections)
         self.excluded_sections = list(excluded_sections)
-        self.opt = opt
+        # the names are compared with the lines in every lookup, share a single copy of each
+        self.opt = {k: sys.intern(v) for k, v in opt.items()}
         self.section_headers = section_headers
+        # names of the sections, as found alone on a stripped and lowered line
+        self._opt_values = frozenset(opt.values())
+        # the sections are fixed at construction
+        optional_set = frozenset(self.optional_sections)
+        excluded_set = frozenset(self.excluded_sections)
+        self._mandatory_sections = [s for s in self.opt if s not in optional_set and s not in excluded_set]
+        self._excluded_opt_values = frozenset(self.opt[e] for e in excluded_set)
+        # the last docstring split by _split_sections, its lines, sections' starts and names
+        self._last_sections = None
 
     def __iter__(self):
         return self.opt.__iter__()
@@ -61,9 +160,7 @@ class DocToolsBase(object):
 
     def get_mandatory_sections(self):
         """Get mandatory sections"""
-        return [s for s in self.opt
-                if s not in self.optional_sections and
-                   s not in self.excluded_sections]
+        return self._mandatory_sections
 
     def _get_list_key(self, spaces, lines):
         """ Parse lines and extract the list of key elements.
@@ -85,18 +182,18 @@ class DocToolsBase(object):
         :param key: the key
 
         """
-        data = data.splitlines()
-        init = self.get_section_key_line(data, key)
-        if init == -1:
+        data, starts, names = self._split_sections(data)
+        expected = self.opt[key] + self._section_key_extension
+        if expected not in names:
             return []
-        start, end = self.get_next_section_lines(data[init:])
+        i = names.index(expected)
+        init = starts[i]
+        end = starts[i + 1] if i + 1 < len(starts) else -1
         # get the spacing of line with key
-        spaces = get_leading_spaces(data[init + start])
-        start += init + header_lines
-        if end != -1:
-            end += init
-        else:
-            end = len(data)
+        spaces = get_leading_spaces(data[init])
+        start = init + header_lines
+        # the line preceding next section is not part of this one
+        end = end - 1 if end != -1 else len(data)
 
         return self._get_list_key(spaces, data[start:end])
 
@@ -144,18 +241,46 @@ class DocToolsBase(object):
         """
         return self.get_list_key(data, 'param')
 
-    def get_next_section_start_line(self, data):
+    def _iter_section_starts(self, data, start=0):
+        """Iterate over the starting line numbers of the sections.
+
+        :param data: a list of strings containing the docstring's lines
+        :param start: index of the line to start the search from (Default value = 0)
+        :returns: generator of the sections' starting line numbers, in order
+        """
+        raise NotImplementedError
+
+    def _split_sections(self, data):
+        """Split a docstring into lines and find the starting line numbers of its sections.
+        The same docstring is usually looked up for several sections in a row,
+        so the result for the last one is kept.
+
+        :param data: the data to proceed
+        :returns: tuple (lines, starts, names), names being the stripped and lowered
+          lines of the starts. The lines must not be modified
+        """
+        last = self._last_sections
+        if last is not None and last[0] == data:
+            return last[1:]
+        lines = data.splitlines()
+        starts = tuple(self._iter_section_starts(lines))
+        names = tuple(lines[i].strip().lower() for i in starts)
+        self._last_sections = (data, lines, starts, names)
+        return lines, starts, names
+
+    def get_next_section_start_line(self, data, start=0):
         """Get the starting line number of next section.
         It will return -1 if no section was found.
         The section is a section key (e.g. 'Parameters:')
         then the content
 
         :param data: a list of strings containing the docstring's lines
+        :param start: index of the line to start the search from (Default value = 0)
         :returns: the index of next section else -1
         """
-        raise NotImplementedError
+        return next(self._iter_section_starts(data, start), -1)
 
-    def get_next_section_lines(self, data):
+    def get_next_section_lines(self, data, init=0):
         """Get the starting line number and the ending line number of next section.
         It will return (-1, -1) if no section was found.
         The section is a section key (e.g. 'Parameters') then the content
@@ -163,12 +288,17 @@ class DocToolsBase(object):
         the section is at the end.
 
         :param data: the data to proceed
+        :param init: index of the line to start the search from, the starting line
+          number is relative to it and the ending one to the line after the start (Default value = 0)
 
         """
         end = -1
-        start = self.get_next_section_start_line(data)
+        start = self.get_next_section_start_line(data, init)
         if start != -1:
-            end = self.get_next_section_start_line(data[start + 1:])
+            end = self.get_next_section_start_line(data, start + 1)
+            if end != -1:
+                end -= start + 1
+            start -= init
         return start, end
 
     def get_key_section_header(self, key, spaces):
@@ -193,18 +323,11 @@ class DocToolsBase(object):
         :param opt_extension: an optional extension to delimit the opt value
 
         """
-        start = 0
-        init = 0
-        while start != -1:
-            start = self.get_next_section_start_line(data[init:])
-            init += start
-            if start != -1:
-                if data[init].strip().lower() == self.opt[key] + opt_extension:
-                    break
-                init += 1
-        if start != -1:
-            start = init
-        return start
+        expected = self.opt[key] + opt_extension
+        for init in self._iter_section_starts(data):
+            if data[init].strip().lower() == expected:
+                return init
+        return -1
 
 
 class NumpydocTools(DocToolsBase):
@@ -264,29 +387,34 @@ class NumpydocTools(DocToolsBase):
             'see also',
             '.. image::',
         ]
+        # names of the sections returned as is by get_raw_not_managed
+        self._not_managed_opt_values = frozenset(self.opt[k] for k in
+                                                 ('also', 'ref', 'note', 'other', 'example', 'method', 'attr'))
 
-    def get_next_section_start_line(self, data):
-        """Get the starting line number of next section.
-        It will return -1 if no section was found.
+    def _iter_section_starts(self, data, start=0):
+        """Iterate over the starting line numbers of the sections.
         The section is a section key (e.g. 'Parameters') followed by underline
         (made by -), then the content
 
         :param data: a list of strings containing the docstring's lines
         :type data: list(str)
-        :returns: the index of next section else -1
+        :param start: index of the line to start the search from (Default value = 0)
+        :returns: generator of the sections' starting line numbers, in order
 
         """
-        start = -1
-        for i, line in enumerate(data):
-            if start != -1:
-                # we found the key so check if this is the underline
-                if line.strip() and isin_alone(['-' * len(line.strip())], line):
-                    break
-                else:
-                    start = -1
-            if isin_alone(self.opt.values(), line):
-                start = i
-        return start
+        found = -1
+        for i in range(start, len(data)):
+            line = data[i].strip()
+            if found != -1:
+                # we found the key so check if this is the underline, made only of dashes
+                if line and not line.strip('-'):
+                    yield found
+                found = -1
+            if line.lower() in self._opt_values:
+                found = i
+        # a key on the last line
+        if found != -1:
+            yield found
 
     def get_list_key(self, data, key, header_lines=2):
         """Get the list of a key elements.
@@ -300,33 +428,7 @@ class NumpydocTools(DocToolsBase):
         return super(NumpydocTools, self).get_list_key(data, key, header_lines=header_lines)
 
     def _get_list_key(self, spaces, lines):
-        key_list = []
-        parse_key = False
-        key, desc, ptype = None, '', None
-
-        for line in lines:
-            if len(line.strip()) == 0:
-                continue
-            # on the same column of the key is the key
-            curr_spaces = get_leading_spaces(line)
-            if len(curr_spaces) == len(spaces):
-                if parse_key:
-                    key_list.append((key, desc, ptype))
-                elems = line.split(':', 1)
-                key = elems[0].strip()
-                ptype = elems[1].strip() if len(elems) > 1 else None
-                desc = ''
-                parse_key = True
-            else:
-                if len(curr_spaces) > len(spaces):
-                    line = line.replace(spaces, '', 1)
-                if desc:
-                    desc += '\n'
-                desc += line
-        if parse_key:
-            key_list.append((key, desc, ptype))
-
-        return key_list
+        return _numpydoc_list_key_parser(spaces)(lines)
 
     def get_attr_list(self, data):
         """Get the list of attributes.
@@ -343,27 +445,17 @@ class NumpydocTools(DocToolsBase):
         :param data: the data to proceed
 
         """
-        keys = ['also', 'ref', 'note', 'other', 'example', 'method', 'attr']
-        elems = [self.opt[k] for k in self.opt if k in keys]
-        data = data.splitlines()
-        start = 0
-        init = 0
-        raw = ''
-        spaces = None
-        while start != -1:
-            start, end = self.get_next_section_lines(data[init:])
-            if start != -1:
-                init += start
-                if isin_alone(elems, data[init]) and \
-                        not isin_alone([self.opt[e] for e in self.excluded_sections], data[init]):
-                    spaces = get_leading_spaces(data[init])
-                    if end != -1:
-                        section = [d.replace(spaces, '', 1).rstrip() for d in data[init:init + end]]
-                    else:
-                        section = [d.replace(spaces, '', 1).rstrip() for d in data[init:]]
-                    raw += '\n'.join(section) + '\n'
-                init += 2
-        return raw
+        data, starts, names = self._split_sections(data)
+        # the lines of all the sections, each section having at least its key's line
+        raw = []
+        for init, end, name in zip(starts, starts[1:] + (-1,), names):
+            if name in self._not_managed_opt_values and name not in self._excluded_opt_values:
+                spaces = get_leading_spaces(data[init])
+                sp_len = len(spaces)
+                # the line preceding next section is not part of this one
+                lines = data[init:end - 1] if end != -1 else data[init:]
+                raw.extend((d[sp_len:] if d.startswith(spaces) else d).rstrip() for d in lines)
+        return '\n'.join(raw) + '\n' if raw else ''
 
     def get_key_section_header(self, key, spaces):
         """Get the key of the header section
@@ -379,6 +471,8 @@ class NumpydocTools(DocToolsBase):
 
 class GoogledocTools(DocToolsBase):
     """ """
+    _section_key_extension = ':'
+
     def __init__(self,
                  first_line=None,
                  optional_sections=('raise'),
@@ -414,6 +508,8 @@ class GoogledocTools(DocToolsBase):
                                                  'raise': 'Raises',
                                              },
                                              )
+        # names of the sections followed by a colon
+        self._opt_values_colon = frozenset(v + ':' for v in self.opt.values())
 
     def get_section_key_line(self, data, key, opt_extension=':'):
         """Get the next section line for a given key.
@@ -428,7 +524,9 @@ class GoogledocTools(DocToolsBase):
     def _get_list_key(self, spaces, lines):
         key_list = []
         parse_key = False
-        key, desc, ptype = None, '', None
+        # the description's lines, none of them being empty
+        key, desc, ptype = None, [], None
+        sp_len = len(spaces)
         param_spaces = 0
 
         for line in lines:
@@ -439,7 +537,7 @@ class GoogledocTools(DocToolsBase):
                 param_spaces = len(curr_spaces)
             if len(curr_spaces) == param_spaces:
                 if parse_key:
-                    key_list.append((key, desc, ptype))
+                    key_list.append((key, '\n'.join(desc), ptype))
                 if ':' in line:
                     elems = line.split(':', 1)
                     ptype = None
@@ -453,41 +551,35 @@ class GoogledocTools(DocToolsBase):
                             tend = key.index(',')
                         ptype = key[tstart:tend].strip()
                         key = key[:tstart - 1].strip()
-                    desc = elems[1].strip()
+                    first_line = elems[1].strip()
+                    desc = [first_line] if first_line else []
                     parse_key = True
                 else:
                     if len(curr_spaces) > len(spaces):
-                        line = line.replace(spaces, '', 1)
-                    if desc:
-                        desc += '\n'
-                    desc += line
+                        line = line[sp_len:] if line.startswith(spaces) else line
+                    desc.append(line)
             else:
                 if len(curr_spaces) > len(spaces):
-                    line = line.replace(spaces, '', 1)
-                if desc:
-                    desc += '\n'
-                desc += line
+                    line = line[sp_len:] if line.startswith(spaces) else line
+                desc.append(line)
         if parse_key or desc:
-            key_list.append((key, desc, ptype))
+            key_list.append((key, '\n'.join(desc), ptype))
 
         return key_list
 
-    def get_next_section_start_line(self, data):
-        """Get the starting line number of next section.
-        It will return -1 if no section was found.
+    def _iter_section_starts(self, data, start=0):
+        """Iterate over the starting line numbers of the sections.
         The section is a section key (e.g. 'Parameters:')
         then the content
 
         :param data: a list of strings containing the docstring's lines
-        :returns: the index of next section else -1
+        :param start: index of the line to start the search from (Default value = 0)
+        :returns: generator of the sections' starting line numbers, in order
 
         """
-        start = -1
-        for i, line in enumerate(data):
-            if isin_alone([k + ":" for k in self.opt.values()], line):
-                start = i
-                break
-        return start
+        for i in range(start, len(data)):
+            if data[i].strip().lower() in self._opt_values_colon:
+                yield i
 
     def get_key_section_header(self, key, spaces):
         """Get the key of the section header
@@ -531,8 +623,20 @@ class DocsTools(object):
         self.tagstyles = []
         self._set_available_styles()
         self.params: list[ParamsConfig] = params
+        # the known parameters names and the regex searching them
+        self._params_re = None
         self.numpydoc = NumpydocTools()
         self.googledoc = GoogledocTools()
+        # lowered lines starting with a section name, for the styles with groups
+        self._groups_line_re = _line_start_re(name for names in self.groups.values() for name in names)
+        self._googledoc_line_re = _line_start_re(self.googledoc.opt.values())
+        self._numpydoc_line_re = _line_start_re(self.numpydoc.opt.values())
+        self._numpydoc_keyword_re = re.compile(r'^.*?(?:%s)' % '|'.join(map(re.escape, self.numpydoc.keywords)),
+                                               re.M)
+        # regexes telling the kind of a tag style line, by input style
+        self._line_classifiers = {}
+        # detected styles by docstring, the style only depends on the docstring which is often detected again
+        self._detected_styles = {}
 
     def _set_available_styles(self):
         """Set the internal styles list and available options in a structure as following:
@@ -572,6 +676,26 @@ class DocsTools(object):
                     'return': ['returns', 'return'],
                     'raise': ['raises', 'exceptions', 'raise', 'exception']
                     }
+        # the names of the keys by style, and the styles parsed as tag styles
+        self._names = {style: {key: self.opt[key][style]['name'] for key in self.opt} for style in self.tagstyles}
+        self._tagstyles_unknown = frozenset(self.tagstyles + ['unknown'])
+        # the distinct names of each style, as several keys can share a name
+        self._elem_names = {style: tuple(dict.fromkeys(names.values())) for style, names in self._names.items()}
+        # match a lowered line starting with one of the group's names
+        self._group_res = {key: re.compile(r'\s*(?:%s)' % '|'.join(map(re.escape, names)))
+                           for key, names in self.groups.items()}
+        # Every key name starts with its style's prefix, which appears nowhere else in the names,
+        # so the occurrences never overlap. Names found at a same place are prefixes of the longest
+        # one, hence matching the longest name first and weighting it by the number of names of
+        # each style it starts with gives the same counts as counting each name separately.
+        names = sorted({self.opt[key][style]['name'] for key in self.opt for style in self.tagstyles},
+                       key=len, reverse=True)
+        self._tags_re = re.compile('|'.join(map(re.escape, names)))
+        # weights of each name, in the order of the tag styles
+        self._tags_weights = {}
+        for name in names:
+            self._tags_weights[name] = tuple(sum(name.startswith(self.opt[key][style]['name']) for key in self.opt)
+                                             for style in self.tagstyles)
 
     def autodetect_style(self, data):
         """Determine the style of a docstring,
@@ -582,43 +706,55 @@ class DocsTools(object):
         :returns: the style detected else 'unknown'
         :rtype: str
 
+        """
+        detected_style = self._detected_styles.get(data)
+        if detected_style is None:
+            if len(self._detected_styles) >= _DETECTED_STYLES_SIZE:
+                self._detected_styles.clear()
+            detected_style = self._detected_styles[data] = self._detect_style(data)
+        self.style['in'] = detected_style
+
+        return detected_style
+
+    def clear_style_cache(self):
+        """Forget the styles already detected by autodetect_style"""
+        self._detected_styles.clear()
+
+    def _detect_style(self, data):
+        """Determine the style of a docstring.
+
+        :param data: the docstring's data to recognize.
+        :type data: str
+        :returns: the style detected else 'unknown'
+        :rtype: str
+
         """
         # evaluate styles with keys
 
-        found_keys = defaultdict(int)
-        for style in self.tagstyles:
-            for key in self.opt:
-                found_keys[style] += data.count(self.opt[key][style]['name'])
-        fkey = max(found_keys, key=found_keys.get)
-        detected_style = fkey if found_keys[fkey] else 'unknown'
+        found_keys = [0] * len(self.tagstyles)
+        for name, count in collections.Counter(self._tags_re.findall(data)).items():
+            for i, weight in enumerate(self._tags_weights[name]):
+                found_keys[i] += count * weight
+        fkey = max(range(len(found_keys)), key=found_keys.__getitem__)
+        detected_style = self.tagstyles[fkey] if found_keys[fkey] else 'unknown'
 
         # evaluate styles with groups
 
         if detected_style == 'unknown':
-            found_groups = 0
-            found_googledoc = 0
-            found_numpydoc = 0
-            found_numpydocsep = 0
-            for line in data.strip().splitlines():
-                for key in self.groups:
-                    found_groups += 1 if isin_start(self.groups[key], line) else 0
-                for key in self.googledoc:
-                    found_googledoc += 1 if isin_start(self.googledoc[key], line) else 0
-                for key in self.numpydoc:
-                    found_numpydoc += 1 if isin_start(self.numpydoc[key], line) else 0
-                if line.strip() and isin_alone(['-' * len(line.strip())], line):
-                    found_numpydocsep += 1
-                elif isin(self.numpydoc.keywords, line):
-                    found_numpydoc += 1
+            data = data.lower()
+            # numpydoc wins whatever the other counts are, so it is looked for first
             # TODO: check if not necessary to have > 1??
-            if found_numpydoc and found_numpydocsep:
+            if ((self._numpydoc_line_re.search(data) or self._numpydoc_keyword_re.search(data))
+                    and _NUMPYDOC_UNDERLINE_RE.search(data)):
                 detected_style = 'numpydoc'
-            elif found_googledoc >= found_groups:
-                detected_style = 'google'
-            elif found_groups:
-                detected_style = 'groups'
-        self.style['in'] = detected_style
-
+            else:
+                # a line starts with at most one name of each of these styles
+                found_groups = len(self._groups_line_re.findall(data))
+                found_googledoc = len(self._googledoc_line_re.findall(data))
+                if found_googledoc >= found_groups:
+                    detected_style = 'google'
+                elif found_groups:
+                    detected_style = 'groups'
         return detected_style
 
     def set_input_style(self, style):
@@ -628,7 +764,7 @@ class DocsTools(object):
         :type style: str
 
         """
-        self.style['in'] = style
+        self.style['in'] = sys.intern(style)
 
     def _get_options(self, style):
         """Get the list of keywords for a particular style
@@ -648,7 +784,7 @@ class DocsTools(object):
 
         """
         target = 'out' if target == 'out' else 'in'
-        return self.opt[key][self.style[target]]['name']
+        return self._names[self.style[target]][key]
 
     def get_sep(self, key='param', target='in'):
         """Get the separator of current style.
@@ -682,6 +818,8 @@ class DocsTools(object):
 
         """
         start, end = -1, -1
+        if '>>>' not in data:
+            return start, end
         datalst = data.splitlines()
         for i, line in enumerate(datalst):
             if start > -1:
@@ -700,16 +838,23 @@ class DocsTools(object):
         :param key: the key category
         :returns: the found line number else -1
 
+        """
+        return self._get_group_key_line(data.splitlines(), key)
+
+    def _get_group_key_line(self, lines, key):
+        """Get the next group-style key's line number in already split lines.
+
+        :param lines: list of the lines to parse
+        :param key: the key category
+        :returns: the found line number else -1
+
         """
         idx = -1
-        for i, line in enumerate(data.splitlines()):
-            if isin_start(self.groups[key], line):
+        group_re = self._group_res[key]
+        for i, line in enumerate(lines):
+            if group_re.match(line.lower()):
                 idx = i
         return idx
-#        search = '\s*(%s)' % '|'.join(self.groups[key])
-#        m = re.match(search, data.lower())
-#        if m:
-#            key_param = m.group(1)
 
     def get_group_key_index(self, data, key):
         """Get the next groups style's starting line index for a key
@@ -719,13 +864,8 @@ class DocsTools(object):
         :returns: the index if found else -1
 
         """
-        idx = -1
-        li = self.get_group_key_line(data, key)
-        if li != -1:
-            idx = 0
-            for line in data.splitlines()[:li]:
-                idx += len(line) + len('\n')
-        return idx
+        lines = data.splitlines()
+        return _line_index(lines, self._get_group_key_line(lines, key))
 
     def get_group_line(self, data):
         """Get the next group-style key's line.
@@ -733,10 +873,19 @@ class DocsTools(object):
         :param data: the data to proceed
         :returns: the line number
 
+        """
+        return self._get_group_line(data.splitlines())
+
+    def _get_group_line(self, lines):
+        """Get the next group-style key's line in already split lines.
+
+        :param lines: list of the lines to parse
+        :returns: the line number
+
         """
         idx = -1
         for key in self.groups:
-            i = self.get_group_key_line(data, key)
+            i = self._get_group_key_line(lines, key)
             if (i < idx and i != -1) or idx == -1:
                 idx = i
         return idx
@@ -748,13 +897,8 @@ class DocsTools(object):
         :returns: the index if found else -1
 
         """
-        idx = -1
-        li = self.get_group_line(data)
-        if li != -1:
-            idx = 0
-            for line in data.splitlines()[:li]:
-                idx += len(line) + len('\n')
-        return idx
+        lines = data.splitlines()
+        return _line_index(lines, self._get_group_line(lines))
 
     def get_key_index(self, data, key, starting=True):
         """Get from a docstring the next option with a given key.
@@ -767,29 +911,36 @@ class DocsTools(object):
         :rtype: integer
 
         """
-        key = self.opt[key][self.style['in']]['name']
+        return self._get_name_index(data, self._names[self.style['in']][key], starting)
+
+    def _get_name_index(self, data, key, starting=True):
+        """Get from a docstring the next option with a given name.
+
+        :param data: string to parse
+        :param key: the name of the key in the input style, e.g. '@param'
+        :param starting: does the key element must start the line (Default value = True)
+        :returns: index of found element else -1
+
+        """
         if key.startswith(':returns'):
             data = data.replace(':return:', ':returns:')  # see issue no_spec_full_comment
         idx = len(data)
-        ini = 0
-        loop = True
+        # search from the character following a key not starting its line
+        pos = 0
         if key in data:
-            while loop:
-                i = data.find(key)
-                if i != -1:
-                    if starting:
-                        if not data[:i].rstrip(' \t').endswith('\n') and len(data[:i].strip()) > 0:
-                            ini = i + 1
-                            data = data[ini:]
-                        else:
-                            idx = ini + i
-                            loop = False
-                    else:
-                        idx = ini + i
-                        loop = False
-                else:
-                    loop = False
-        if idx == len(data):
+            while True:
+                i = data.find(key, pos)
+                if i == -1:
+                    break
+                if starting:
+                    before = data[pos:i]
+                    if not before.rstrip(' \t').endswith('\n') and len(before.strip()) > 0:
+                        pos = i + 1
+                        continue
+                idx = i
+                break
+        # compared to the length of the data remaining after the skipped keys
+        if idx == len(data) - pos:
             idx = -1
         return idx
 
@@ -805,10 +956,13 @@ class DocsTools(object):
 
         """
         idx = len(data)
-        for opt in self.opt.keys():
-            i = self.get_key_index(data, opt, starting)
+        for name in self._elem_names[self.style['in']]:
+            i = self._get_name_index(data, name, starting)
             if i < idx and i != -1:
                 idx = i
+                if not idx:
+                    # nothing can be found before
+                    break
         if idx == len(data):
             idx = -1
         return idx
@@ -819,11 +973,12 @@ class DocsTools(object):
     def get_elem_param(self):
         """TODO """
 
-    def get_raise_indexes(self, data):
+    def get_raise_indexes(self, data, pos=0):
         """Get from a docstring the next raise name indexes.
         In javadoc style it is after @raise.
 
         :param data: string to parse
+        :param pos: index to start the search from (Default value = 0)
         :returns: start and end indexes of found element else (-1, -1)
           or else (-2, -2) if try to use params style but no parameters were provided.
           Note: the end index is the index after the last name character
@@ -831,18 +986,16 @@ class DocsTools(object):
 
         """
         start, end = -1, -1
-        stl_param = self.opt['raise'][self.style['in']]['name']
-        if self.style['in'] in self.tagstyles + ['unknown']:
-            idx_p = self.get_key_index(data, 'raise')
+        stl_param = self._names[self.style['in']]['raise']
+        if self.style['in'] in self._tagstyles_unknown:
+            idx_p = self.get_key_index(data[pos:] if pos else data, 'raise')
             if idx_p >= 0:
-                idx_p += len(stl_param)
-                m = re.match(RAISES_NAME_REGEX, data[idx_p:].strip())
+                idx_p += pos + len(stl_param)
+                m = _RAISES_NAME_RE.match(data, idx_p)
                 if m:
-                    param = m.group(1)
-                    start = idx_p + data[idx_p:].find(param)
-                    end = start + len(param)
+                    start, end = m.span(1)
 
-        if self.style['in'] in ['groups', 'unknown'] and (start, end) == (-1, -1):
+        if self.style['in'] in {'groups', 'unknown'} and (start, end) == (-1, -1):
             # search = '\s*(%s)' % '|'.join(self.groups['param'])
             # m = re.match(search, data.lower())
             # if m:
@@ -866,26 +1019,23 @@ class DocsTools(object):
             _, prev = self.get_raise_indexes(data)
         if prev < 0:
             return -1, -1
-        m = re.match(r'\W*(\w+)', data[prev:])
+        m = _FIRST_WORD_RE.match(data, prev)
         if m:
-            first = m.group(1)
-            start = data[prev:].find(first)
-            if start >= 0:
-                start += prev
-                if self.style['in'] in self.tagstyles + ['unknown']:
-                    end = self.get_elem_index(data[start:])
-                    if end >= 0:
-                        end += start
-                if self.style['in'] in ['params', 'unknown'] and end == -1:
-                    p1, _ = self.get_raise_indexes(data[start:])
-                    if p1 >= 0:
-                        end = p1
-                    else:
-                        end = len(data)
+            start = m.start(1)
+            if self.style['in'] in self._tagstyles_unknown:
+                end = self.get_elem_index(data[start:])
+                if end >= 0:
+                    end += start
+            if self.style['in'] in {'params', 'unknown'} and end == -1:
+                p1, _ = self.get_raise_indexes(data[start:])
+                if p1 >= 0:
+                    end = p1
+                else:
+                    end = len(data)
 
         return start, end
     
-    def __parse_param(self, striped: str, style_param: str, ret: dict[str, dict]):
+    def __parse_param(self, striped: str, style_param: str, ret: dict[str, ParamInfo]):
         current_element = ParsedElement(
             name=None,
             nature='param',
@@ -898,28 +1048,29 @@ class DocsTools(object):
             print("WARNING: malformed docstring parameter")
             param_part = None
         if param_part is not None:
-            res = re.split(r'\s+', param_part.strip())
-            if len(res) == 1:
-                param_name = res[0].strip()
+            res = param_part.split()
+            if len(res) < 2:
+                # no name in a blank part
+                param_name = res[0] if res else None
             elif len(res) == 2:
-                param_type, param_name = res[0].strip(), res[1].strip()
+                param_type, param_name = res
             else:
                 print("WARNING: malformed docstring parameter")
         if param_name:
             # keep track in case of multiline
             current_element.name = param_name
             if param_name not in ret:
-                ret[param_name] = {'type': None, 'type_in_param': None, 'description': None}
+                ret[param_name] = ParamInfo()
             if param_type:
-                ret[param_name]['type_in_param'] = param_type
+                ret[param_name].type_in_param = param_type
             if param_description:
-                ret[param_name]['description'] = param_description.strip()
+                ret[param_name].description = param_description.strip()
         else:
             print("WARNING: malformed docstring parameter: unable to extract name")
         
         return current_element
     
-    def __parse_param_type(self, striped: str, style_type: str, ret: dict[str, dict]):
+    def __parse_param_type(self, striped: str, style_type: str, ret: dict[str, ParamInfo]):
         current_element = ParsedElement(
             name=None,
             nature='type',
@@ -937,98 +1088,128 @@ class DocsTools(object):
             # keep track in case of multiline
             current_element.name = param_name
             if param_name not in ret:
-                ret[param_name] = {'type': None, 'type_in_param': None, 'description': None}
+                ret[param_name] = ParamInfo()
             if param_type:
-                ret[param_name]['type'] = param_type.strip()
+                ret[param_name].type = param_type.strip()
         
         return current_element
     
     def _extra_tagstyle_elements(self, data):
         ret = {}
-        style_param = self.opt['param'][self.style['in']]['name']
-        style_type = self.opt['type'][self.style['in']]['name']
-        style_rtype = self.opt['rtype'][self.style['in']]['name']
+        style_param = self._names[self.style['in']]['param']
+        style_type = self._names[self.style['in']]['type']
+        style_rtype = self._names[self.style['in']]['rtype']
         # fixme for return and raise, ignore last char as there's an optional 's' at the end and they are not managed in this function
-        style_return = self.opt['return'][self.style['in']]['name'][:-1]
-        style_raise = self.opt['raise'][self.style['in']]['name'][:-1]
+        style_return = self._names[self.style['in']]['return'][:-1]
+        style_raise = self._names[self.style['in']]['raise'][:-1]
+        classifier = self._line_classifiers.get(self.style['in'])
+        if classifier is None:
+            # the alternatives are tried in the order of the former startswith checks
+            classifier = self._line_classifiers[self.style['in']] = re.compile(
+                r'(?P<param>%s)|(?P<type>%s)|(?P<other>%s)' % (
+                    re.escape(style_param), re.escape(style_type),
+                    '|'.join(map(re.escape, (style_raise, style_return, style_rtype)))))
+        # the character starting all the tags of the style
+        prefix = style_param[0]
         current_element = None
+        # if the following lines continue the current element's description
+        describing = False
+        # the lines continuing the current element's description
+        continued = []
         for line in data.splitlines():
-            # parameter statement
             striped = line.strip()
-            if striped.startswith(style_param):
+            # most lines are descriptions, not starting with the style's tags prefix
+            m = classifier.match(striped) if striped.startswith(prefix) else None
+            kind = m.lastgroup if m else None
+            if kind is not None and continued:
+                self.__continue_description(ret, current_element.name, continued)
+                continued = []
+            # parameter statement
+            if kind == 'param':
                 current_element = self.__parse_param(striped, style_param, ret)
+                describing = True
             # type statement
-            elif striped.startswith(style_type):
+            elif kind == 'type':
                 current_element = self.__parse_param_type(striped, style_type, ret)
-            elif striped.startswith(style_raise) or striped.startswith(style_return) or striped.startswith(style_rtype):
-                # fixme not managed in this function
-                current_element = ParsedElement(
-                    nature='raise-return',
-                    name=None,
-                )
-            elif current_element:
+                describing = True
+            elif kind == 'other':
+                # fixme raises and returns are not managed in this function
+                describing = False
+            elif describing:
                 # suppose to be line of a multiline element
-                if current_element.nature == 'param':
-                    if ret[current_element.name]['description'] is None:
-                        ret[current_element.name]['description'] = ''
-                    ret[current_element.name]['description'] += f"\n{line}"
-                elif current_element.nature == 'type':
-                    if ret[current_element.name]['description'] is None:
-                        ret[current_element.name]['description'] = ''
-                    ret[current_element.name]['description'] += f"\n{line}"
+                continued.append(line)
+        if continued:
+            self.__continue_description(ret, current_element.name, continued)
         return ret
 
+    @staticmethod
+    def __continue_description(ret: dict[str, ParamInfo], name: str, lines: list[str]):
+        description = ret[name].description
+        ret[name].description = (description or '') + ''.join(f"\n{line}" for line in lines)
+
     def _extract_not_tagstyle_old_way(self, data):
         ret = {}
-        listed = 0
-        loop = True
-        maxi = 10000  # avoid infinite loop but should never happen
-        i = 0
-        while loop:
-            i += 1
-            if i > maxi:
-                loop = False
-            start, end = self.get_param_indexes(data)
-            if start >= 0:
-                param = data[start: end]
-                desc = ''
-                param_end = end
-                start, end = self.get_param_description_indexes(data, prev=end)
-                if start > 0:
-                    desc = data[start: end].strip()
-                if end == -1:
-                    end = param_end
-                ptype = ''
-                start, pend = self.get_param_type_indexes(data, name=param, prev=end)
-                if start > 0:
-                    ptype = data[start: pend].strip()
-                if param in ret:
-                    print(f"WARNING: unexpected parsing duplication of docstring parameter '{param}'")
-                ret[param] = {'type': ptype, 'type_in_param': None, 'description': desc}
-                data = data[end:]
-                listed += 1
-            else:
-                loop = False
-        if i > maxi:
-            print("WARNING: an infinite loop was reached while extracting docstring parameters (>10000). This should never happen!!!")
+        # the parameters before it are already extracted
+        cursor = 0
+        while True:
+            start, end = self.get_param_indexes(data, cursor)
+            if start < 0:
+                break
+            param = data[start: end]
+            desc = ''
+            param_end = end
+            start, end = self.get_param_description_indexes(data, prev=end)
+            if start > 0:
+                desc = data[start: end].strip()
+            if end == -1:
+                end = param_end
+            ptype = ''
+            start, pend = self.get_param_type_indexes(data, name=param, prev=end)
+            if start > 0:
+                ptype = data[start: pend].strip()
+            if param in ret:
+                print(f"WARNING: unexpected parsing duplication of docstring parameter '{param}'")
+            ret[param] = ParamInfo(type=ptype, description=desc)
+            # each parameter is after the previous one, stop if the parser does not move on
+            if end <= cursor:
+                print("WARNING: the extraction of docstring parameters did not progress. This should never happen!!!")
+                break
+            cursor = end
         return ret
 
-    def extract_elements(self, data) -> dict:
+    def extract_elements(self, data) -> dict[str, ParamInfo]:
         """Extract parameter name, description and type from docstring"""
-        ret = []
-        tagstyles = self.tagstyles + ['unknown']
-        if self.style['in'] in tagstyles:
-            ret = self._extra_tagstyle_elements(data)
-        else:
-            # fixme enhance management of other styles
-            ret = self._extract_not_tagstyle_old_way(data)
-        return ret
-
-    def get_param_indexes(self, data):
+        if self.style['in'] in self._tagstyles_unknown:
+            return self._extra_tagstyle_elements(data)
+        # fixme enhance management of other styles
+        return self._extract_not_tagstyle_old_way(data)
+
+    def extract_elements_batch(self, datas) -> list:
+        """Extract parameters name, description and type from several docstrings.
+        The result is the same as calling `extract_elements` on each of them.
+        On a free-threaded Python they are extracted in parallel threads sharing the instance,
+        so the input style and the known parameters must not change during a batch.
+        The parse step doesn't use it yet: it extracts one docstring at a time, each after
+        setting the known parameters of its own element.
+
+        :param datas: the docstrings' data
+        :returns: the extracted elements of each docstring, in the same order
+        """
+        datas = list(datas)
+        is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+        if is_gil_enabled is None or is_gil_enabled() or len(datas) < 2:
+            return [self.extract_elements(data) for data in datas]
+        # the first one builds the regexes of the style in this thread, so the others only read them
+        first = self.extract_elements(datas[0])
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            return [first] + list(executor.map(self.extract_elements, datas[1:]))
+
+    def get_param_indexes(self, data, pos=0):
         """Get from a docstring the next parameter name indexes.
         In javadoc style it is after @param.
 
         :param data: string to parse
+        :param pos: index to start the search from (Default value = 0)
         :returns: start and end indexes of found element else (-1, -1)
           or else (-2, -2) if try to use params style but no parameters were provided.
           Note: the end index is the index after the last name character
@@ -1037,40 +1218,43 @@ class DocsTools(object):
         """
         # TODO: new method to extract an element's name so will be available for @param and @types and other styles (:param, \param)
         start, end = -1, -1
-        stl_param = self.opt['param'][self.style['in']]['name']
-        if self.style['in'] in self.tagstyles + ['unknown']:
-            idx_p = self.get_key_index(data, 'param')
+        stl_param = self._names[self.style['in']]['param']
+        if self.style['in'] in self._tagstyles_unknown:
+            idx_p = self.get_key_index(data[pos:] if pos else data, 'param')
             if idx_p >= 0:
-                idx_p += len(stl_param)
-                m = re.match(r'^([\w]+)', data[idx_p:].strip())
+                idx_p += pos + len(stl_param)
+                m = _NAME_RE.match(data, idx_p)
                 if m:
-                    param = m.group(1)
-                    start = idx_p + data[idx_p:].find(param)
-                    end = start + len(param)
+                    start, end = m.span(1)
 
-        if self.style['in'] in ['groups', 'unknown'] and (start, end) == (-1, -1):
+        if self.style['in'] in {'groups', 'unknown'} and (start, end) == (-1, -1):
             # search = '\s*(%s)' % '|'.join(self.groups['param'])
             # m = re.match(search, data.lower())
             # if m:
             #    key_param = m.group(1)
             pass
 
-        if self.style['in'] in ['params', 'groups', 'unknown'] and (start, end) == (-1, -1):
+        if self.style['in'] in {'params', 'groups', 'unknown'} and (start, end) == (-1, -1):
             if not self.params:
                 return -2, -2
-            idx = -1
-            param = None
-            for p in self.params:
-                p = p.param
-                i = data.find('\n' + p)
-                if i >= 0:
-                    if idx == -1 or i < idx:
-                        idx = i
-                        param = p
-            if idx != -1:
-                start, end = idx, idx + len(param)
+            # the earliest parameter, the first one of the list if several start there
+            m = self._get_params_re().search(data, pos)
+            if m:
+                start, end = m.start(), m.start() + len(m.group(1))
         return start, end
 
+    def _get_params_re(self):
+        """Get the regex matching a newline followed by one of the known parameters names.
+        It is compiled again only when the names change.
+
+        :returns: the compiled regex, its group 1 being the parameter's name
+
+        """
+        names = tuple(p.param for p in self.params)
+        if self._params_re is None or self._params_re[0] != names:
+            self._params_re = (names, re.compile(r'\n(%s)' % '|'.join(map(re.escape, names))))
+        return self._params_re[1]
+
     def get_param_description_indexes(self, data, prev=None):
         """Get from a docstring the next parameter's description.
         In javadoc style it is after @param.
@@ -1086,25 +1270,22 @@ class DocsTools(object):
             _, prev = self.get_param_indexes(data)
         if prev < 0:
             return -1, -1
-        m = re.match(r'\W*(\w+)', data[prev:])
+        m = _FIRST_WORD_RE.match(data, prev)
         if m:
-            first = m.group(1)
-            start = data[prev:].find(first)
-            if start >= 0:
-                if '\n' in data[prev:prev+start]:
-                    # avoid to get next element as a description
-                    return -1, -1
-                start += prev
-                if self.style['in'] in self.tagstyles + ['unknown']:
-                    end = self.get_elem_index(data[start:])
-                    if end >= 0:
-                        end += start
-                if self.style['in'] in ['params', 'unknown'] and end == -1:
-                    p1, _ = self.get_param_indexes(data[start:])
-                    if p1 >= 0:
-                        end = p1
-                    else:
-                        end = len(data)
+            start = m.start(1)
+            if data.find('\n', prev, start) != -1:
+                # avoid to get next element as a description
+                return -1, -1
+            if self.style['in'] in self._tagstyles_unknown:
+                end = self.get_elem_index(data[start:])
+                if end >= 0:
+                    end += start
+            if self.style['in'] in {'params', 'unknown'} and end == -1:
+                p1, _ = self.get_param_indexes(data, start)
+                if p1 >= 0:
+                    end = p1
+                else:
+                    end = len(data)
 
         return start, end
 
@@ -1122,25 +1303,25 @@ class DocsTools(object):
 
         """
         start, end = -1, -1
-        stl_type = self.opt['type'][self.style['in']]['name']
+        stl_type = self._names[self.style['in']]['type']
         if not prev:
             _, prev = self.get_param_description_indexes(data)
         if prev >= 0:
-            if self.style['in'] in self.tagstyles + ['unknown']:
+            if self.style['in'] in self._tagstyles_unknown:
                 idx = self.get_elem_index(data[prev:])
                 if idx >= 0 and data[prev + idx:].startswith(stl_type):
                     idx = prev + idx + len(stl_type)
-                    m = re.match(r'\W*(\w+)\W+(\w+)\W*', data[idx:].strip())
+                    m = _TWO_WORDS_RE.match(data, idx)
                     if m:
                         param = m.group(1).strip()
                         if (name and param == name) or not name:
                             desc = m.group(2)
-                            start = data[idx:].find(desc) + idx
+                            start = data.find(desc, idx)
                             end = self.get_elem_index(data[start:])
                             if end >= 0:
                                 end += start
 
-            if self.style['in'] in ['params', 'unknown'] and (start, end) == (-1, -1):
+            if self.style['in'] in {'params', 'unknown'} and (start, end) == (-1, -1):
                 # TODO: manage this
                 pass
 
@@ -1158,18 +1339,17 @@ class DocsTools(object):
 
         """
         start, end = -1, -1
-        stl_return = self.opt['return'][self.style['in']]['name']
-        if self.style['in'] in self.tagstyles + ['unknown']:
+        stl_return = self._names[self.style['in']]['return']
+        if self.style['in'] in self._tagstyles_unknown:
             idx = self.get_key_index(data, 'return')
             idx_abs = idx
             # search starting description
             if idx >= 0:
                 # FIXME: take care if a return description starts with <, >, =,...
-                m = re.match(r'\W*(\w+)', data[idx_abs + len(stl_return):])
+                m = _FIRST_WORD_RE.match(data, idx_abs + len(stl_return))
                 if m:
                     first = m.group(1)
-                    idx = data[idx_abs:].find(first)
-                    idx_abs += idx
+                    idx_abs = data.find(first, idx_abs)
                     start = idx_abs
                 else:
                     idx = -1
@@ -1179,7 +1359,7 @@ class DocsTools(object):
                 idx_abs += idx
                 end = idx_abs
 
-        if self.style['in'] in ['params', 'unknown'] and (start, end) == (-1, -1):
+        if self.style['in'] in {'params', 'unknown'} and (start, end) == (-1, -1):
             # TODO: manage this
             pass
 
@@ -1197,24 +1377,23 @@ class DocsTools(object):
 
         """
         start, end = -1, -1
-        stl_rtype = self.opt['rtype'][self.style['in']]['name']
-        if self.style['in'] in self.tagstyles + ['unknown']:
+        stl_rtype = self._names[self.style['in']]['rtype']
+        if self.style['in'] in self._tagstyles_unknown:
             dstart, dend = self.get_return_description_indexes(data)
             # search the start
             if dstart >= 0 and dend > 0:
                 idx = self.get_elem_index(data[dend:])
                 if idx >= 0 and data[dend + idx:].startswith(stl_rtype):
                     idx = dend + idx + len(stl_rtype)
-                    m = re.match(r'\W*(\w+)', data[idx:])
+                    m = _FIRST_WORD_RE.match(data, idx)
                     if m:
-                        first = m.group(1)
-                        start = data[idx:].find(first) + idx
+                        start = m.start(1)
             # search the end
             idx = self.get_elem_index(data[start:])
             if idx > 0:
                 end = idx + start
 
-        if self.style['in'] in ['params', 'unknown'] and (start, end) == (-1, -1):
+        if self.style['in'] in {'params', 'unknown'} and (start, end) == (-1, -1):
             # TODO: manage this
             pass
 
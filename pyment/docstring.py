@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import functools
 import re
 
 __author__ = "A. Daouzli"
@@ -29,10 +30,42 @@ Formats supported at the time:
 
 """
 
+# a group style line: the name and its description
+_GROUP_PARAM_RE = re.compile(r'^\W*(\w+)[\W\s]+(\w[\s\w]+)')
+_GROUP_RAISE_RE = re.compile(r'^\W*([\w.]+)[\W\s]+(\w[\s\w]+)')
+# a group style line with only a name
+_GROUP_NAME_RE = re.compile(r'^\W*(\w+)\W*')
+# the parts of a signature enclosed by brackets or quotes, up to the first closing character,
+# and its characters with a meaning out of them
+_SIGNATURE_OPENERS = frozenset('({[\'"')
+_SIGNATURE_ENCLOSED = r'''\([^)]*\)?|\{[^}]*\}?|\[[^\]]*\]?|'[^']*'?|"[^"]*"?'''
+_SIGNATURE_COMMENT_RE = re.compile(_SIGNATURE_ENCLOSED + r'|#')
+_SIGNATURE_TOKEN_RE = re.compile(_SIGNATURE_ENCLOSED + r'''|[:,= ]|[^:,= ({\['"]+''')
+# the fields of a signature's parameter, all extracted as strings
+_PARAMS_CONFIG_FIELDS = tuple(field.name for field in fields(ParamsConfig))
+
+_DOCSTRING_QUOTES = ('"""', "'''")
+
+
+def _strip_docstring_quotes(raw):
+    """Strip a raw docstring and remove its surrounding triple quotes if any"""
+    raw = raw.strip()
+    if raw.startswith(_DOCSTRING_QUOTES):
+        raw = raw[3:]
+    if raw.endswith(_DOCSTRING_QUOTES):
+        raw = raw[:-3]
+    return raw
+
 
 class DocString(object):
     """This class represents the docstring"""
-    
+
+    __slots__ = (
+        'comment_config', 'case_config', 'before_lim', 'trailing_space', 'type_stub', 'element', 'docs',
+        '_normalized_raw', 'parsed_elem', 'parsed_docs', 'generated_docs',
+        'hint_rtype_priority', 'hint_type_priority', 'rst_type_in_param_priority',
+    )
+
     def __init__(self, elem_raw, comment_config: CommentBuilderConfig, case_config: CaseConfig, spaces='', docs_raw=None, input_style=None,
                  trailing_space=True, type_stub=False, before_lim=''):
         """
@@ -65,11 +98,7 @@ class DocString(object):
             self.set_input_style(input_style)
         self.element = case_config
         if docs_raw:
-            docs_raw = docs_raw.strip()
-            if docs_raw.startswith('"""') or docs_raw.startswith("'''"):
-                docs_raw = docs_raw[3:]
-            if docs_raw.endswith('"""') or docs_raw.endswith("'''"):
-                docs_raw = docs_raw[:-3]
+            docs_raw = _strip_docstring_quotes(docs_raw)
         self.docs = {
             'in': {
                 'raw': docs_raw,
@@ -97,14 +126,14 @@ class DocString(object):
         elif (len(spaces) % 4) == 0 or spaces == '':
             # FIXME: should bug if tabs for class or function (as spaces=='')
             self.docs['out']['spaces'] = spaces + ' ' * 4
+        # the input docstring without its indentation, computed once per parsing
+        self._normalized_raw = None
         self.parsed_elem = False
         self.parsed_docs = False
         self.generated_docs = False
-        self._options = {
-            'hint_rtype_priority': True,  # priority in type hint else in docstring
-            'hint_type_priority': True,  # priority in type hint else in docstring
-            'rst_type_in_param_priority': True,  # in reST docstring priority on type present in param else on type
-        }
+        self.hint_rtype_priority = True  # priority in type hint else in docstring
+        self.hint_type_priority = True  # priority in type hint else in docstring
+        self.rst_type_in_param_priority = True  # in reST docstring priority on type present in param else on type
 
         self.parse_definition()
 
@@ -146,8 +175,7 @@ class DocString(object):
         :type style: str
 
         """
-        # TODO: use a setter
-        self.comment_config.dst.style['in'] = style
+        self.comment_config.dst.set_input_style(style)
 
     def get_spaces(self):
         """Get the output docstring initial spaces.
@@ -164,6 +192,7 @@ class DocString(object):
 
         """
         self.docs['out']['spaces'] = spaces
+        self._normalized_raw = None
 
     def parse_definition(self, raw=None):
         """Parses the element's elements (type, name and parameters) :)
@@ -196,101 +225,92 @@ class DocString(object):
             # retrieves the name
             self.element.name = l[:l.find('(')].strip()
             if not is_class:
-                parameters, return_type = self._extract_signature_elements(self._remove_signature_comment(l))
-                # remove self and cls parameters if any and also empty params (if no param)
-                remove_keys = []
-                for params in parameters:
-                    if params.param in ['self', 'cls']:
-                        remove_keys.append(params)
-                    elif not params.param:
-                        remove_keys.append(params)
-                for key in remove_keys:
-                    parameters.remove(key)
+                parameters, return_type = self._parse_signature(l)
                 if return_type:
                     self.element.rtype = return_type # TODO manage this
-                self.element.params.extend(parameters)
+                self.element.params.extend(ParamsConfig(*params) for params in parameters)
         self.parsed_elem = True
 
-    def _remove_signature_comment(self, txt):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_signature(txt):
+        """Parse the parameters and return type of a signature, once for all the elements sharing it
+
+        :param txt: the signature without its type, e.g. "methode(param1, param2='default'):"
+        :returns: the parameters as (param, type, default) tuples and the return type
+
+        """
+        parameters, return_type = DocString._extract_signature_elements(DocString._remove_signature_comment(txt))
+        # remove self and cls parameters if any and also empty params (if no param)
+        parameters = tuple(
+            tuple(getattr(params, name) for name in _PARAMS_CONFIG_FIELDS)
+            for params in parameters if params.param and params.param not in ('self', 'cls')
+        )
+        return parameters, return_type
+
+    @staticmethod
+    def _remove_signature_comment(txt):
         """If there is a comment at the end of the signature statement, remove it"""
-        ret = ""
-        inside = None
-        end_inside = {'(': ')', '{': '}', '[': ']', "'": "'", '"': '"'}
-        for c in txt:
-            if (inside and end_inside[inside] != c) or (not inside and c in end_inside.keys()):
-                if not inside:
-                    inside = c
-                ret += c
-                continue
-            if inside and c == end_inside[inside]:
-                inside = None
-                ret += c
-                continue
-            if not inside and c == '#':
+        # the enclosed parts are matched whole, so a '#' found is outside of them
+        for m in _SIGNATURE_COMMENT_RE.finditer(txt):
+            if m.group() == '#':
                 # found a comment so signature is finished we stop parsing
-                break
-            ret += c
-        return ret
+                return txt[:m.start()]
+        return txt
 
-    def _extract_signature_elements(self, txt: str) -> tuple[list[ParamsConfig], str]:
+    @staticmethod
+    def _extract_signature_elements(txt: str) -> tuple[list[ParamsConfig], str]:
         start = txt.find('(') + 1
         end_start = txt.rfind(')')
         end_end = txt.rfind(':')
         return_type = txt[end_start + 1:end_end].replace(' ', '').replace('\t', '').replace('->', '')
         elems: list[ParamsConfig] = []
-        elem_idx = 0
         reading = 'param'
         current_param = ParamsConfig()
         elems.append(current_param)
-        inside = None
-        end_inside = {'(': ')', '{': '}', '[': ']', "'": "'", '"': '"'}
-        for c in txt[start:end_start]:
-            if (inside and end_inside[inside] != c) or (not inside and c in end_inside.keys()):
-                if not inside:
-                    inside = c
+        for m in _SIGNATURE_TOKEN_RE.finditer(txt[start:end_start]):
+            token = m.group()
+            if token[0] in _SIGNATURE_OPENERS:
+                # an enclosed part, e.g. a subscripted type or a string default value
                 if reading == 'type':
-                    current_param.type += c
+                    current_param.type += token
                 elif reading == 'default':
-                    current_param.default += c
+                    current_param.default += token
                 else:
                     # FIXME: this should not happen!
-                    raise Exception("unexpected nested element after "+str(inside)+" while reading "+reading)
-                continue
-            if inside and c == end_inside[inside]:
-                inside = None
-            if reading == 'param':
-                if c not in ': ,=':
-                    current_param.param += c
-                else:
-                    if c == ' ' and current_param.param or c != ' ':
+                    raise Exception("unexpected nested element after "+token[0]+" while reading "+reading)
+            elif token == ',':
+                current_param = ParamsConfig()
+                elems.append(current_param)
+                reading = 'param'
+            elif reading == 'param':
+                if token == ' ':
+                    if current_param.param:
                         reading = 'after_param'
+                elif token == ':':
+                    reading = 'type'
+                elif token == '=':
+                    reading = 'default'
+                else:
+                    current_param.param += token
             elif reading == 'type':
-                if c not in ',=':
-                    current_param.type += c
+                if token == '=':
+                    reading = 'default'
                 else:
-                    reading = 'after_type'
+                    current_param.type += token
             elif reading == 'default':
-                if c != ',':
-                    current_param.default += c
-                else:
-                    reading = 'after_default'
-            if reading.startswith('after_'):
-                if reading == 'after_param' and c == ':':
-                    reading = 'type'
-                elif c == ',':
-                    elem_idx += 1
-                    current_param = ParamsConfig()
-                    elems.append(current_param)
-                    reading = 'param'
-                elif c == '=':
-                    reading = 'default'
+                current_param.default += token
+            elif token == '=':
+                reading = 'default'
+            elif token == ':' and reading == 'after_param':
+                reading = 'type'
 
         # strip extracted elements
         for elem in elems:
-            for field in fields(elem):
-                value = getattr(elem, field.name, None)
+            for name in _PARAMS_CONFIG_FIELDS:
+                value = getattr(elem, name)
                 if value is not None:
-                    setattr(elem, field.name, value.strip())
+                    setattr(elem, name, value.strip())
         return elems, return_type.strip()
 
     def _extract_docs_doctest(self):
@@ -304,7 +324,6 @@ class DocString(object):
         data = self.docs['in']['raw']
         start, end = self.comment_config.dst.get_doctests_indexes(data)
         while start != -1:
-            print (start, end)
             result = True
             datalst = data.splitlines()
             if self.docs['in']['doctests'] != "":
@@ -318,10 +337,21 @@ class DocString(object):
             self.docs['out']['doctests'] = data
         return result
     
+    def _get_normalized_raw(self):
+        """Get the input docstring with its lines right stripped and unindented.
+
+        :returns: the normalized docstring
+
+        """
+        if self._normalized_raw is None:
+            spaces = self.docs['out']['spaces']
+            self._normalized_raw = '\n'.join([d.rstrip().replace(spaces, '', 1) for d in self.docs['in']['raw'].splitlines()])
+        return self._normalized_raw
+
     @log_function
     def __extract_current_desc(self):
         # FIXME: the indentation of descriptions is lost
-        data = '\n'.join([d.rstrip().replace(self.docs['out']['spaces'], '', 1) for d in self.docs['in']['raw'].splitlines()])
+        data = self._get_normalized_raw()
         if self.comment_config.dst.style['in'] == 'groups':
             idx = self.comment_config.dst.get_group_index(data)
         elif self.comment_config.dst.style['in'] == 'google':
@@ -357,7 +387,7 @@ class DocString(object):
 
     def _extract_groupstyle_docs_params(self):
         """Extract group style parameters"""
-        data = '\n'.join([d.rstrip().replace(self.docs['out']['spaces'], '', 1) for d in self.docs['in']['raw'].splitlines()])
+        data = self._get_normalized_raw()
         idx = self.comment_config.dst.get_group_key_line(data, 'param')
         if idx >= 0:
             data = data.splitlines()[idx + 1:]
@@ -369,12 +399,13 @@ class DocString(object):
                 param = None
                 desc = ''
                 ptype = ''
-                m = re.match(r'^\W*(\w+)[\W\s]+(\w[\s\w]+)', line.strip())
+                line = line.strip()
+                m = _GROUP_PARAM_RE.match(line)
                 if m:
                     param = m.group(1).strip()
                     desc = m.group(2).strip()
                 else:
-                    m = re.match(r'^\W*(\w+)\W*', line.strip())
+                    m = _GROUP_NAME_RE.match(line)
                     if m:
                         param = m.group(1).strip()
                 if param:
@@ -382,68 +413,44 @@ class DocString(object):
 
     def _extract_tagstyle_docs_params(self):
         """ """
-        data = '\n'.join([d.rstrip().replace(self.docs['out']['spaces'], '', 1) for d in self.docs['in']['raw'].splitlines()])
+        data = self._get_normalized_raw()
         extracted = self.comment_config.dst.extract_elements(data)
         for param_name, param in extracted.items():
-            param_type = param['type']
-            if self._options['rst_type_in_param_priority'] and param['type_in_param']:
-                param_type = param['type_in_param']
-            desc = param['description'] if param['description'] else ""
+            param_type = param.type
+            if self.rst_type_in_param_priority and param.type_in_param:
+                param_type = param.type_in_param
+            desc = param.description if param.description else ""
             self.docs['in']['params'].append((param_name, desc, param_type))
 
-    def _old_extract_tagstyle_docs_params(self):
-        """ """
-        data = '\n'.join([d.rstrip().replace(self.docs['out']['spaces'], '', 1) for d in self.docs['in']['raw'].splitlines()])
-        listed = 0
-        loop = True
-        maxi = 10000  # avoid infinite loop but should never happen
-        i = 0
-        while loop:
-            i += 1
-            if i > maxi:
-                loop = False
-            start, end = self.comment_config.dst.get_param_indexes(data)
-            if start >= 0:
-                param = data[start: end]
-                desc = ''
-                param_end = end
-                start, end = self.comment_config.dst.get_param_description_indexes(data, prev=end)
-                if start > 0:
-                    desc = data[start: end].strip()
-                if end == -1:
-                    end = param_end
-                ptype = ''
-                start, pend = self.comment_config.dst.get_param_type_indexes(data, name=param, prev=end)
-                if start > 0:
-                    ptype = data[start: pend].strip()
-                # a parameter is stored with: (name, description, type)
-                self.docs['in']['params'].append((param, desc, ptype))
-                data = data[end:]
-                listed += 1
-            else:
-                loop = False
-        if i > maxi:
-            print("WARNING: an infinite loop was reached while extracting docstring parameters (>10000). This should never happen!!!")
+    def _extract_numpydoc_docs_params(self):
+        """Extract numpydoc style parameters"""
+        self.docs['in']['params'] += self.comment_config.dst.numpydoc.get_param_list(self._get_normalized_raw())
+
+    def _extract_googledoc_docs_params(self):
+        """Extract google style parameters"""
+        self.docs['in']['params'] += self.comment_config.dst.googledoc.get_param_list(self._get_normalized_raw())
+
+    # parameters extraction by input style, nothing is extracted for the other styles
+    _docs_params_extractors = {
+        'numpydoc': _extract_numpydoc_docs_params,
+        'google': _extract_googledoc_docs_params,
+        'groups': _extract_groupstyle_docs_params,
+        'javadoc': _extract_tagstyle_docs_params,
+        'reST': _extract_tagstyle_docs_params,
+    }
 
     def _extract_docs_params(self):
         """Extract parameters description and type from docstring. The internal computed parameters list is
         composed by tuples (parameter, description, type).
 
         """
-        if self.comment_config.dst.style['in'] == 'numpydoc':
-            data = '\n'.join([d.rstrip().replace(self.docs['out']['spaces'], '', 1) for d in self.docs['in']['raw'].splitlines()])
-            self.docs['in']['params'] += self.comment_config.dst.numpydoc.get_param_list(data)
-        elif self.comment_config.dst.style['in'] == 'google':
-            data = '\n'.join([d.rstrip().replace(self.docs['out']['spaces'], '', 1) for d in self.docs['in']['raw'].splitlines()])
-            self.docs['in']['params'] += self.comment_config.dst.googledoc.get_param_list(data)
-        elif self.comment_config.dst.style['in'] == 'groups':
-            self._extract_groupstyle_docs_params()
-        elif self.comment_config.dst.style['in'] in ['javadoc', 'reST']:
-            self._extract_tagstyle_docs_params()
+        extractor = self._docs_params_extractors.get(self.comment_config.dst.style['in'])
+        if extractor:
+            extractor(self)
 
     def _extract_groupstyle_docs_raises(self):
         """ """
-        data = '\n'.join([d.rstrip().replace(self.docs['out']['spaces'], '', 1) for d in self.docs['in']['raw'].splitlines()])
+        data = self._get_normalized_raw()
         idx = self.comment_config.dst.get_group_key_line(data, 'raise')
         if idx >= 0:
             data = data.splitlines()[idx + 1:]
@@ -454,12 +461,13 @@ class DocString(object):
                 line = data[i]
                 param = None
                 desc = ''
-                m = re.match(r'^\W*([\w.]+)[\W\s]+(\w[\s\w]+)', line.strip())
+                line = line.strip()
+                m = _GROUP_RAISE_RE.match(line)
                 if m:
                     param = m.group(1).strip()
                     desc = m.group(2).strip()
                 else:
-                    m = re.match(r'^\W*(\w+)\W*', line.strip())
+                    m = _GROUP_NAME_RE.match(line)
                     if m:
                         param = m.group(1).strip()
                 if param:
@@ -467,51 +475,59 @@ class DocString(object):
 
     def _extract_tagstyle_docs_raises(self):
         """ """
-        data = '\n'.join([d.rstrip().replace(self.docs['out']['spaces'], '', 1) for d in self.docs['in']['raw'].splitlines()])
-        listed = 0
-        loop = True
-        maxi = 10000  # avoid infinite loop but should never happen
-        i = 0
-        while loop:
-            i += 1
-            if i > maxi:
-                loop = False
-            start, end = self.comment_config.dst.get_raise_indexes(data)
-            if start >= 0:
-                param = data[start: end]
-                desc = ''
-                start, end = self.comment_config.dst.get_raise_description_indexes(data, prev=end)
-                if start > 0:
-                    desc = data[start: end].strip()
-                # a parameter is stored with: (name, description)
-                self.docs['in']['raises'].append((param, desc))
-                data = data[end:]
-                listed += 1
-            else:
-                loop = False
-        if i > maxi:
-            print("WARNING: an infinite loop was reached while extracting docstring parameters (>10000). This should never happen!!!")
+        data = self._get_normalized_raw()
+        # the raises before it are already extracted
+        cursor = 0
+        while True:
+            start, end = self.comment_config.dst.get_raise_indexes(data, cursor)
+            if start < 0:
+                break
+            param = data[start: end]
+            desc = ''
+            start, end = self.comment_config.dst.get_raise_description_indexes(data, prev=end)
+            if end == -1:
+                # the description goes up to the last character, which is left to parse
+                end = len(data) - 1
+            if start > 0:
+                desc = data[start: end].strip()
+            # a parameter is stored with: (name, description)
+            self.docs['in']['raises'].append((param, desc))
+            # each raise is after the previous one, stop if the parser does not move on
+            if end <= cursor:
+                print("WARNING: the extraction of docstring raises did not progress. This should never happen!!!")
+                break
+            cursor = end
+
+    def _extract_numpydoc_docs_raises(self):
+        """Extract numpydoc style raises"""
+        self.docs['in']['raises'] += self.comment_config.dst.numpydoc.get_raise_list(self._get_normalized_raw())
+
+    def _extract_googledoc_docs_raises(self):
+        """Extract google style raises"""
+        self.docs['in']['raises'] += self.comment_config.dst.googledoc.get_raise_list(self._get_normalized_raw())
+
+    # raises extraction by input style, nothing is extracted for the other styles
+    _docs_raises_extractors = {
+        'numpydoc': _extract_numpydoc_docs_raises,
+        'google': _extract_googledoc_docs_raises,
+        'groups': _extract_groupstyle_docs_raises,
+        'javadoc': _extract_tagstyle_docs_raises,
+        'reST': _extract_tagstyle_docs_raises,
+    }
 
     def _extract_docs_raises(self):
         """Extract raises description from docstring. The internal computed raises list is
         composed by tuples (raise, description).
 
         """
-        if self.comment_config.dst.style['in'] == 'numpydoc':
-            data = '\n'.join([d.rstrip().replace(self.docs['out']['spaces'], '', 1) for d in self.docs['in']['raw'].splitlines()])
-            self.docs['in']['raises'] += self.comment_config.dst.numpydoc.get_raise_list(data)
-        if self.comment_config.dst.style['in'] == 'google':
-            data = '\n'.join([d.rstrip().replace(self.docs['out']['spaces'], '', 1) for d in self.docs['in']['raw'].splitlines()])
-            self.docs['in']['raises'] += self.comment_config.dst.googledoc.get_raise_list(data)
-        elif self.comment_config.dst.style['in'] == 'groups':
-            self._extract_groupstyle_docs_raises()
-        elif self.comment_config.dst.style['in'] in ['javadoc', 'reST']:
-            self._extract_tagstyle_docs_raises()
+        extractor = self._docs_raises_extractors.get(self.comment_config.dst.style['in'])
+        if extractor:
+            extractor(self)
 
     def _extract_groupstyle_docs_return(self):
         """ """
         # TODO: manage rtype
-        data = '\n'.join([d.rstrip().replace(self.docs['out']['spaces'], '', 1) for d in self.docs['in']['raw'].splitlines()])
+        data = self._get_normalized_raw()
         idx = self.comment_config.dst.get_group_key_line(data, 'return')
         if idx >= 0:
             data = data.splitlines()[idx + 1:]
@@ -522,7 +538,7 @@ class DocString(object):
 
     def _extract_tagstyle_docs_return(self):
         """ """
-        data = '\n'.join([d.rstrip().replace(self.docs['out']['spaces'], '', 1) for d in self.docs['in']['raw'].splitlines()])
+        data = self._get_normalized_raw()
         start, end = self.comment_config.dst.get_return_description_indexes(data)
         if start >= 0:
             if end >= 0:
@@ -536,26 +552,36 @@ class DocString(object):
             else:
                 self.docs['in']['rtype'] = data[start:].rstrip()
 
+    def _extract_numpydoc_docs_return(self):
+        """Extract numpydoc style return"""
+        self.docs['in']['return'] = self.comment_config.dst.numpydoc.get_return_list(self._get_normalized_raw())
+        # TODO: fix this
+        self.docs['in']['rtype'] = None
+
+    def _extract_googledoc_docs_return(self):
+        """Extract google style return"""
+        self.docs['in']['return'] = self.comment_config.dst.googledoc.get_return_list(self._get_normalized_raw())
+        self.docs['in']['rtype'] = None
+
+    # return extraction by input style, nothing is extracted for the other styles
+    _docs_return_extractors = {
+        'numpydoc': _extract_numpydoc_docs_return,
+        'google': _extract_googledoc_docs_return,
+        'groups': _extract_groupstyle_docs_return,
+        'javadoc': _extract_tagstyle_docs_return,
+        'reST': _extract_tagstyle_docs_return,
+    }
+
     def _extract_docs_return(self):
         """Extract return description and type"""
-        if self.comment_config.dst.style['in'] == 'numpydoc':
-            data = '\n'.join([d.rstrip().replace(self.docs['out']['spaces'], '', 1) for d in self.docs['in']['raw'].splitlines()])
-            self.docs['in']['return'] = self.comment_config.dst.numpydoc.get_return_list(data)
-            self.docs['in']['rtype'] = None
-# TODO: fix this
-        elif self.comment_config.dst.style['in'] == 'google':
-            data = '\n'.join([d.rstrip().replace(self.docs['out']['spaces'], '', 1) for d in self.docs['in']['raw'].splitlines()])
-            self.docs['in']['return'] = self.comment_config.dst.googledoc.get_return_list(data)
-            self.docs['in']['rtype'] = None
-        elif self.comment_config.dst.style['in'] == 'groups':
-            self._extract_groupstyle_docs_return()
-        elif self.comment_config.dst.style['in'] in ['javadoc', 'reST']:
-            self._extract_tagstyle_docs_return()
+        extractor = self._docs_return_extractors.get(self.comment_config.dst.style['in'])
+        if extractor:
+            extractor(self)
 
     def _extract_docs_other(self):
         """Extract other specific sections"""
         if self.comment_config.dst.style['in'] == 'numpydoc':
-            data = '\n'.join([d.rstrip().replace(self.docs['out']['spaces'], '', 1) for d in self.docs['in']['raw'].splitlines()])
+            data = self._get_normalized_raw()
             lst = self.comment_config.dst.numpydoc.get_list_key(data, 'also')
             lst = self.comment_config.dst.numpydoc.get_list_key(data, 'ref')
             lst = self.comment_config.dst.numpydoc.get_list_key(data, 'note')
@@ -573,20 +599,22 @@ class DocString(object):
         """
         self.before_lim = before_lim
         if raw is not None:
-            raw = raw.strip()
-            if raw.startswith('"""') or raw.startswith("'''"):
-                raw = raw[3:]
-            if raw.endswith('"""') or raw.endswith("'''"):
-                raw = raw[:-3]
+            raw = _strip_docstring_quotes(raw)
             self.docs['in']['raw'] = raw
             self.comment_config.dst.autodetect_style(raw)
         if self.docs['in']['raw'] is None:
             return
         self.comment_config.dst.set_known_parameters(self.element.params)
         self._extract_docs_doctest()
-        self._extract_docs_params()
+        self._normalized_raw = None
+        data = self._get_normalized_raw()
+        # whatever the style, a single line without any tag can't hold parameters nor raises
+        has_elements = '\n' in data or ':' in data or '@' in data
+        if has_elements:
+            self._extract_docs_params()
         self._extract_docs_return()
-        self._extract_docs_raises()
+        if has_elements:
+            self._extract_docs_raises()
         self._extract_docs_description()
         self._extract_docs_other()
         self.parsed_docs = True
@@ -607,17 +635,12 @@ class DocString(object):
     def __extract_params(self) -> Generator[tuple[str, str, str | None, str | None], None, None]:
         # TODO: manage different in/out styles
         # convert the list of signature's extracted params into a dict with the names of param as keys
-        sig_params = {e.param: {'type': e.type, 'default': e.default} for e in self.element.params}
+        sig_params = {e.param: (e.type, e.default) for e in self.element.params}
         # convert the list of docsting's extracted params into a dict with the names of param as keys
-        docs_params = {
-            name: {
-                'description': desc,
-                'type': param_type,
-            } for name, desc, param_type in self.docs['in']['params']
-        }
-        for name in sig_params:
+        docs_params = {name: (desc, param_type) for name, desc, param_type in self.docs['in']['params']}
+        hint_type_priority = self.hint_type_priority
+        for name, (sig_type, sig_default) in sig_params.items():
             # WARNING: Note that if a param in docstring isn't in the signature params, it will be dropped
-            sig_type, sig_default = sig_params[name]['type'], sig_params[name]['default']
             out_description = ""
             out_type = sig_type if sig_type else None
             out_default = sig_default if sig_default else None
@@ -625,9 +648,9 @@ class DocString(object):
             if out_default:
                 out_default = normalize_default_value(out_default)
             if name in docs_params:
-                out_description = docs_params[name]['description']
-                if not out_type or (not self._options['hint_type_priority'] and docs_params[name]['type']):
-                    out_type = docs_params[name]['type']
+                out_description, docs_type = docs_params[name]
+                if not out_type or (not hint_type_priority and docs_type):
+                    out_type = docs_type
             yield name, out_description, out_type, out_default
     
     def _set_params(self):
@@ -670,7 +693,7 @@ class DocString(object):
         else:
             rcomment = self.docs['in']['return']
             rtype = self.docs['in']['rtype']
-        if (self._options['hint_rtype_priority'] or not self.docs['out']['rtype']) and self.element.rtype:
+        if (self.hint_rtype_priority or not self.docs['out']['rtype']) and self.element.rtype:
             rtype = self.element.rtype
         
         return rtype, rcomment
@@ -701,11 +724,11 @@ class DocString(object):
         
         element_type = self.element.deftype
         if element_type == 'class':
-            return ClassCommentBuilder(self.comment_config, self.case_config, strategy)
+            return ClassCommentBuilder.acquire(self.comment_config, self.case_config, strategy)
         if element_type == 'module':
-            return ModuleCommentBuilder(self.comment_config, self.case_config, strategy)
+            return ModuleCommentBuilder.acquire(self.comment_config, self.case_config, strategy)
         # 'def' or default
-        return FunctionCommentBuilder(self.comment_config, self.case_config, strategy)
+        return FunctionCommentBuilder.acquire(self.comment_config, self.case_config, strategy)
     
     def _create_builder(self):
         """Create and configure the appropriate builder based on element type.
@@ -731,6 +754,7 @@ class DocString(object):
         """Sets the output raw docstring"""
         builder = self._create_builder()
         self.docs['out']['raw'] = builder.build()
+        builder.release()
     
     @log_function
     def generate_docs(self):
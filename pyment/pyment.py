@@ -29,6 +29,11 @@ __maintainer__ = "A. Daouzli"
 # -accept archives containing source files
 # -dev a server that take sources and send back patches
 
+# the indentation of an element's definition line
+_ELEMENT_INDENT_RE = re.compile(r'^(\s*)[adc]')  # a for async, d for def, c for class
+# the end of an element's definition, eventually followed by a comment
+_ELEMENT_END_RE = re.compile(r''':(|\s*#[^'"]*)$''')
+
 
 class PyComment(object):
     """This class allow to manage several python scripts docstrings.
@@ -327,14 +332,14 @@ class PyComment(object):
                     continue
                 reading_element = 'start'
                 elem = l
-                m = re.match(r'^(\s*)[adc]', ln)  # a for async, d for def, c for class
+                m = _ELEMENT_INDENT_RE.match(ln)
                 if m is not None and m.group(1) is not None:
                     spaces: str = m.group(1)
                 else:
                     spaces = ''
                 # the end of definition should be ':' and eventually a comment following
                 # FIXME: but this is missing eventually use of # inside a string value of parameter
-                if re.search(r''':(|\s*#[^'"]*)$''', l):
+                if _ELEMENT_END_RE.search(l):
                     reading_element = 'end'
             if reading_element == 'end':
                 reading_element = None
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 import functools
-import re
 import os
 
 __author__ = "A. Daouzli"
@@ -23,12 +22,8 @@ def isin_alone(elems, line):
     :type line: str
 
     """
-    found = False
-    for e in elems:
-        if line.strip().lower() == e.lower():
-            found = True
-            break
-    return found
+    line = line.strip().lower()
+    return any(line == e.lower() for e in elems)
 
 
 def isin_start(elems, line):
@@ -38,13 +33,9 @@ def isin_start(elems, line):
     :type line: str
 
     """
-    found = False
-    elems = [elems] if type(elems) is not list else elems
-    for e in elems:
-        if line.lstrip().lower().startswith(e):
-            found = True
-            break
-    return found
+    # startswith tests all the elements of a tuple at once
+    elems = tuple(elems) if type(elems) is list else elems
+    return line.lstrip().lower().startswith(elems)
 
 
 def isin(elems, line):
@@ -54,25 +45,18 @@ def isin(elems, line):
     :type line: str
 
     """
-    found = False
-    for e in elems:
-        if e in line.lower():
-            found = True
-            break
-    return found
+    line = line.lower()
+    return any(e in line for e in elems)
 
 
+@functools.lru_cache(maxsize=4096)
 def get_leading_spaces(data):
     """Get the leading space of a string if it is not empty
 
     :type data: str
 
     """
-    spaces = ''
-    m = re.match(r'^(\s*)', data)
-    if m:
-        spaces = m.group(1)
-    return spaces
+    return data[:len(data) - len(data.lstrip())]
 
 
 def normalize_default_value(default_value):
@@ -114,7 +98,7 @@ def normalize_default_value(default_value):
 
 
 def from_dict(dc_type: type[T], data: dict) -> T:
-    class_fields = {f.name for f in fields(dc_type)}
+    class_fields = {f.name for f in fields(dc_type) if f.init}
     filtered_data = {k: v for k, v in data.items() if k in class_fields}
 
     return dc_type(**filtered_data)
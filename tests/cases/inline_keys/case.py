@@ -0,0 +1,11 @@
+def compute(notes, other, a):
+    """Compute it, see :param notes: and :param other: inline.
+
+    :param a: the a
+    """
+    pass
+
+
+def compute_all(notes, other):
+    """Compute it, see :param notes: and :param other: inline."""
+    pass
@@ -0,0 +1,87 @@
+#!/usr/bin/python
+
+import unittest
+
+from pyment.comment_builder.builder import _pools
+from pyment.comment_builder.function import FunctionCommentBuilder, _format_name_as_description_cached
+from pyment.configs import CommentBuilderConfig, CaseConfig
+from pyment.docstring import DocString
+
+
+def build_docstring(comment_config, raw='def compute(first, second=1):', docs_raw=None):
+    case_config = CaseConfig(spaces='    ', name='compute', type='def', raw=raw)
+    return DocString(raw, comment_config=comment_config, case_config=case_config, docs_raw=docs_raw).get_raw_docs()
+
+
+class FormatNameTests(unittest.TestCase):
+
+    def test_camel_case(self):
+        self.assertEqual(_format_name_as_description_cached('calculateTotalSum'), 'Calculate total sum')
+        self.assertEqual(_format_name_as_description_cached('UserAccountManager'), 'User account manager')
+
+    def test_non_ascii_camel_case(self):
+        self.assertEqual(_format_name_as_description_cached('calculerÉtat'), 'Calculer état')
+        self.assertEqual(_format_name_as_description_cached('ÉtatCourant_àJour'), 'État courant à jour')
+
+
+class BuilderPoolTests(unittest.TestCase):
+
+    def test_released_builder_is_cleared(self):
+        config = CommentBuilderConfig()
+        builder = FunctionCommentBuilder.acquire(config, CaseConfig(), None)
+        builder.set_name('compute').set_params([('first', 'the first', 'int', None)]).set_raises([('KeyError', '')])
+        builder.release()
+        self.assertIsNone(builder.config)
+        self.assertIsNone(builder.case_config)
+        self.assertIsNone(builder.element_name)
+        self.assertEqual(builder.params, ())
+        self.assertEqual(builder.raises, ())
+        self.assertEqual(repr(builder), '<FunctionCommentBuilder name=None>')
+
+    def test_double_release(self):
+        _pools.by_class.clear()
+        builder = FunctionCommentBuilder.acquire(CommentBuilderConfig(), CaseConfig(), None)
+        builder.release()
+        builder.release()
+        self.assertEqual(_pools.by_class[FunctionCommentBuilder], [builder])
+
+    def test_reused_builder(self):
+        config = CommentBuilderConfig()
+        _pools.by_class.clear()
+        fresh = build_docstring(config)
+        pooled = _pools.by_class[FunctionCommentBuilder][-1]
+        build_docstring(config, 'def other(value) -> int:',
+                        '"""Other.\n\n:param value: the value\n:returns: a number\n:raises KeyError: missing"""')
+        self.assertEqual(build_docstring(config), fresh)
+        self.assertIs(_pools.by_class[FunctionCommentBuilder][-1], pooled)
+
+
+class ConfigTests(unittest.TestCase):
+
+    def test_same_config_twice(self):
+        for style in ('reST', 'numpydoc', 'google'):
+            with self.subTest(style=style):
+                config = CommentBuilderConfig(output_style=style)
+                self.assertEqual(build_docstring(config), build_docstring(config))
+
+    def test_changed_config(self):
+        for style in ('reST', 'numpydoc', 'google'):
+            with self.subTest(style=style):
+                config = CommentBuilderConfig(output_style=style)
+                before = build_docstring(config)
+                config.first_line = False
+                config.show_default_value = False
+                config.num_of_spaces = 2
+                after = build_docstring(config)
+                self.assertNotEqual(before, after)
+                expected = CommentBuilderConfig(output_style=style, first_line=False, show_default_value=False,
+                                                num_of_spaces=2)
+                self.assertEqual(build_docstring(expected), after)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/python
+
+import concurrent.futures
+import gc
+import sys
+import unittest
+import weakref
+from unittest import mock
+
+from pyment.docs_tools import DocsTools
+
+reST_docs = '''Compute it.
+
+:param first: the first
+:type first: int
+:returns: the result
+'''
+javadoc_docs = '''Compute it.
+
+@param first: the first
+@return: the result
+'''
+
+
+class DetectStyleTests(unittest.TestCase):
+
+    def test_cached_style(self):
+        tools = DocsTools()
+        self.assertEqual(tools.autodetect_style(reST_docs), 'reST')
+        self.assertEqual(tools.autodetect_style(javadoc_docs), 'javadoc')
+        self.assertEqual(tools._detected_styles, {reST_docs: 'reST', javadoc_docs: 'javadoc'})
+        self.assertEqual(tools.autodetect_style(reST_docs), 'reST')
+        self.assertEqual(tools.style['in'], 'reST')
+
+    def test_clear_style_cache(self):
+        tools = DocsTools()
+        tools.autodetect_style(reST_docs)
+        tools.clear_style_cache()
+        self.assertEqual(tools._detected_styles, {})
+        self.assertEqual(tools.autodetect_style(javadoc_docs), 'javadoc')
+        self.assertEqual(tools.autodetect_style(reST_docs), 'reST')
+
+    def test_no_reference_cycle(self):
+        tools = DocsTools()
+        tools.autodetect_style(reST_docs)
+        ref = weakref.ref(tools)
+        gc.disable()
+        try:
+            del tools
+            self.assertIsNone(ref())
+        finally:
+            gc.enable()
+
+
+class ExtractElementsBatchTests(unittest.TestCase):
+
+    datas = {
+        'reST': [reST_docs, ':param a: x\n  more x\n:type a: str\n:param int b: y\n', 'No parameter.', ''],
+        'javadoc': [javadoc_docs, '@param a: x\n@type a: str\n@param b:\n  y\n', 'No parameter.'],
+    }
+
+    def check_batch(self):
+        for style, datas in self.datas.items():
+            with self.subTest(style=style):
+                tools = DocsTools(style_in=style)
+                expected = [tools.extract_elements(data) for data in datas]
+                tools = DocsTools(style_in=style)
+                batch = tools.extract_elements_batch(iter(datas))
+                self.assertEqual(batch, expected)
+
+    def test_sequential(self):
+        with mock.patch.object(sys, '_is_gil_enabled', return_value=True, create=True):
+            self.check_batch()
+
+    def test_threaded(self):
+        with mock.patch.object(sys, '_is_gil_enabled', return_value=False, create=True), \
+                mock.patch('concurrent.futures.ThreadPoolExecutor.map',
+                           autospec=True, side_effect=concurrent.futures.ThreadPoolExecutor.map) as executor_map:
+            self.check_batch()
+        self.assertTrue(executor_map.called)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
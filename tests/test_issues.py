@@ -66,6 +66,7 @@ ISSUES = [
     ('without_indent', {'type_tags': False, 'first_line': False, 'indent_empty_lines': False}, False),
     ('with_indent', {'type_tags': False, 'first_line': False, 'indent_empty_lines': True}, False),
     ('multiline_comment', {'type_tags': False, 'first_line': False, 'indent_empty_lines': False}, False),
+    ('inline_keys', {}, False),
 ]
 
 